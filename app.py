@@ -4,18 +4,26 @@ Main Streamlit application for AI-Powered Recruitment Assistant
 
 import streamlit as st
 import pandas as pd
+import io
 import json
+import shutil
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from src.agents.resume_bot import ResumeBot
-from src.agents.filter_ai import FilterAI
-from src.agents.store_keeper import StoreKeeper
-from src.agents.hr_bridge import HRBridge
-from src.agents.time_bot import TimeBot
-from src.agents.notify_bot import NotifyBot
-from src.utils.helpers import generate_id, get_timestamp
+from typing import Dict, List, Any, Optional, Tuple
+from src.utils.helpers import generate_id, get_timestamp, parse_csv_list
 from src.schema.data_models import Job, Candidate, Interview
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+PAGE_SIZE = 50
+
+# Columns shown in the listing tables; full records stay in the store
+DISPLAY_COLUMNS = {
+    'jobs': ['id', 'title', 'department', 'experience_level', 'status', 'created_at'],
+    'candidates': ['id', 'name', 'email', 'phone', 'experience', 'education', 'job_id', 'status', 'created_at'],
+    'interviews': ['id', 'candidate_id', 'job_id', 'interviewer', 'scheduled_time', 'type', 'status'],
+}
+
 st.set_page_config(
     page_title="AI Recruitment Assistant",
     page_icon="🤖",
@@ -23,15 +31,90 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-if 'agents' not in st.session_state:
-    st.session_state.agents = {
-        'resume_bot': ResumeBot(),
-        'filter_ai': FilterAI(),
-        'store_keeper': StoreKeeper(),
-        'hr_bridge': HRBridge(),
-        'time_bot': TimeBot(),
-        'notify_bot': NotifyBot()
-    }
+@st.cache_resource
+def get_resume_bot():
+    """Get the shared ResumeBot, importing it on first use"""
+    from src.agents.resume_bot import ResumeBot
+    return ResumeBot()
+
+@st.cache_resource
+def get_filter_ai():
+    """Get the shared FilterAI, importing it on first use"""
+    from src.agents.filter_ai import FilterAI
+    return FilterAI()
+
+@st.cache_resource
+def get_store_keeper():
+    """Get the shared StoreKeeper, importing it on first use"""
+    from src.agents.store_keeper import StoreKeeper
+    return StoreKeeper()
+
+@st.cache_resource
+def get_hr_bridge():
+    """Get the shared HRBridge, importing it on first use"""
+    from src.agents.hr_bridge import HRBridge
+    return HRBridge()
+
+@st.cache_resource
+def get_time_bot():
+    """Get the shared TimeBot, importing it on first use"""
+    from src.agents.time_bot import TimeBot
+    return TimeBot()
+
+@st.cache_resource
+def get_notify_bot():
+    """Get the shared NotifyBot, importing it on first use"""
+    from src.agents.notify_bot import NotifyBot
+    return NotifyBot()
+
+@st.cache_resource
+def get_store_versions() -> Dict[str, int]:
+    """Get write counters used to invalidate cached store reads"""
+    return {'jobs': 0, 'candidates': 0, 'interviews': 0}
+
+def bump_store_version(kind: str):
+    """Invalidate cached reads after a write to the store"""
+    get_store_versions()[kind] += 1
+
+@st.cache_data
+def _cached_jobs(version: int) -> List[Dict[str, Any]]:
+    return get_store_keeper().get_jobs()
+
+@st.cache_data
+def _cached_candidates(version: int) -> List[Dict[str, Any]]:
+    return get_store_keeper().get_candidates()
+
+@st.cache_data
+def _cached_interviews(version: int) -> List[Dict[str, Any]]:
+    return get_store_keeper().get_interviews()
+
+def get_jobs() -> List[Dict[str, Any]]:
+    """Get jobs, served from cache until the next job write"""
+    return _cached_jobs(get_store_versions()['jobs'])
+
+def get_candidates() -> List[Dict[str, Any]]:
+    """Get candidates, served from cache until the next candidate write"""
+    return _cached_candidates(get_store_versions()['candidates'])
+
+def get_interviews() -> List[Dict[str, Any]]:
+    """Get interviews, served from cache until the next interview write"""
+    return _cached_interviews(get_store_versions()['interviews'])
+
+@st.cache_resource
+def _notify_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="notify")
+
+def _send_notification(send, *args):
+    try:
+        result = send(*args)
+        if not result.get('success'):
+            print(f"Notification failed: {result.get('message')}")
+    except Exception as e:
+        print(f"Error sending notification: {e}")
+
+def queue_notification(send, *args):
+    """Send a notification in the background without blocking the page"""
+    _notify_pool().submit(_send_notification, send, *args)
 
 if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
@@ -39,6 +122,155 @@ if 'chat_history' not in st.session_state:
 if 'current_job' not in st.session_state:
     st.session_state.current_job = None
 
+_READERS = {'jobs': get_jobs, 'candidates': get_candidates, 'interviews': get_interviews}
+
+@st.cache_data
+def _records_frame(kind: str, version: int) -> pd.DataFrame:
+    return pd.DataFrame(_READERS[kind]())
+
+def get_records_frame(kind: str) -> pd.DataFrame:
+    """Get one store collection as a DataFrame, built once per write"""
+    return _records_frame(kind, get_store_versions()[kind])
+
+@st.cache_data
+def _table_frame(kind: str, version: int) -> pd.DataFrame:
+    return _records_frame(kind, version).reindex(columns=DISPLAY_COLUMNS[kind])
+
+@st.fragment
+def show_table(kind: str, key: str):
+    """Render one page of a store collection, limited to its display columns"""
+    df = _table_frame(kind, get_store_versions()[kind])
+    page_count = max(1, -(-len(df) // PAGE_SIZE))
+    page = 1
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key=key)
+    start = (page - 1) * PAGE_SIZE
+    st.dataframe(df.iloc[start:start + PAGE_SIZE], use_container_width=True)
+
+@st.cache_data
+def _dashboard_stats(jobs_version: int, candidates_version: int,
+                     interviews_version: int) -> Dict[str, int]:
+    job_status = Counter(j.get('status') for j in get_jobs())
+    interview_status = Counter(i.get('status') for i in get_interviews())
+    candidate_status = Counter()
+    hired = 0
+    for candidate in get_candidates():
+        candidate_status[candidate.get('status')] += 1
+        if (candidate.get('final_decision') or {}).get('decision') == 'hire':
+            hired += 1
+    
+    return {
+        'total_candidates': sum(candidate_status.values()),
+        'total_jobs': sum(job_status.values()),
+        'total_interviews': sum(interview_status.values()),
+        'active_jobs': job_status['active'],
+        'scheduled_interviews': interview_status['scheduled'],
+        'pending_reviews': candidate_status['new'],
+        'hired': hired
+    }
+
+def get_dashboard_stats() -> Dict[str, int]:
+    """Get dashboard metrics, computed in one pass per collection"""
+    versions = get_store_versions()
+    return _dashboard_stats(versions['jobs'], versions['candidates'], versions['interviews'])
+
+@st.cache_data
+def _count_field(kind: str, version: int, field: str, default: str) -> pd.Series:
+    df = _records_frame(kind, version)
+    values = df[field] if field in df.columns else pd.Series(index=df.index, dtype=object)
+    return values.fillna(default).value_counts(sort=False)
+
+def count_field(kind: str, field: str, default: str) -> pd.Series:
+    """Count records of one kind by a field, cached until the next write"""
+    return _count_field(kind, get_store_versions()[kind], field, default)
+
+@st.fragment
+def show_raw_json(data: Dict[str, Any], key: str):
+    """Render a record as JSON only when the user asks for it"""
+    if st.toggle("Show raw JSON", key=key):
+        st.json(data)
+
+def _criteria_key(filter_criteria: Dict[str, Any]) -> Tuple:
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in filter_criteria.items()
+    ))
+
+@st.cache_data
+def _run_filter(candidates_version: int, jobs_version: int, job_id: str,
+                criteria_key: Tuple) -> Dict[str, Any]:
+    job_data = {j['id']: j for j in get_jobs()}[job_id]
+    filter_criteria = {
+        name: list(value) if isinstance(value, tuple) else value
+        for name, value in criteria_key
+    }
+    job_candidates = [c for c in get_candidates() if c.get('job_id') == job_id]
+    return get_filter_ai().filter_candidates(job_candidates, job_data, filter_criteria)
+
+def filter_job_candidates(job_id: str, filter_criteria: Dict[str, Any]) -> Dict[str, Any]:
+    """Filter and score a job's candidates, reusing results for repeated criteria"""
+    versions = get_store_versions()
+    return _run_filter(versions['candidates'], versions['jobs'], job_id, _criteria_key(filter_criteria))
+
+@st.cache_data
+def _export_csv(candidates_version: int, jobs_version: int, job_id: str,
+                criteria_key: Tuple) -> bytes:
+    result = _run_filter(candidates_version, jobs_version, job_id, criteria_key)
+    return pd.DataFrame(result['filtered_candidates']).to_csv(index=False).encode('utf-8')
+
+def export_filtered_csv(job_id: str, filter_criteria: Dict[str, Any]) -> bytes:
+    """Get the filtered candidates as CSV bytes, cached per criteria"""
+    versions = get_store_versions()
+    return _export_csv(versions['candidates'], versions['jobs'], job_id, _criteria_key(filter_criteria))
+
+def candidate_label(candidate: Dict[str, Any]) -> str:
+    """Get the display label used to pick a candidate"""
+    return f"{candidate['name']} ({candidate['email']})"
+
+@st.cache_data
+def _candidate_choices(candidates_version: int,
+                       status: Optional[str]) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    by_label = {
+        candidate_label(c): c for c in get_candidates()
+        if status is None or c.get('status') == status
+    }
+    return list(by_label), by_label
+
+def get_candidate_choices(status: Optional[str] = None) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """Get selectbox labels and a label-to-candidate index, optionally for one status"""
+    return _candidate_choices(get_store_versions()['candidates'], status)
+
+@st.cache_data
+def _interview_choices(interviews_version: int,
+                       status: Optional[str]) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    by_label = {
+        f"Interview {i['id'][:8]}...": i for i in get_interviews()
+        if status is None or i.get('status') == status
+    }
+    return list(by_label), by_label
+
+def get_interview_choices(status: Optional[str] = None) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """Get selectbox labels and a label-to-interview index, optionally for one status"""
+    return _interview_choices(get_store_versions()['interviews'], status)
+
+@st.cache_data
+def _interviewed_candidate_choices(candidates_version: int,
+                                  interviews_version: int) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    interviews_by_candidate = defaultdict(list)
+    for interview in get_interviews():
+        interviews_by_candidate[interview.get('candidate_id')].append(interview)
+    
+    by_label = {
+        candidate_label(c): dict(c, interviews=interviews_by_candidate[c['id']])
+        for c in get_candidates() if c['id'] in interviews_by_candidate
+    }
+    return list(by_label), by_label
+
+def get_interviewed_candidate_choices() -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """Get selectbox labels and an index of candidates with their interviews attached"""
+    versions = get_store_versions()
+    return _interviewed_candidate_choices(versions['candidates'], versions['interviews'])
+
 def main():
     """Main application function"""
     st.title("🤖 AI-Powered Recruitment Assistant")
@@ -66,28 +298,30 @@ def main():
     elif page == "Analytics":
         show_analytics()
 
-def show_dashboard():
-    """Show dashboard with system overview"""
-    st.header("📊 Dashboard")
-    
-    store_keeper = st.session_state.agents['store_keeper']
-    candidates = store_keeper.get_candidates()
-    jobs = store_keeper.get_jobs()
-    interviews = store_keeper.get_interviews()
+@st.fragment
+def show_dashboard_metrics():
+    """Show dashboard metric columns"""
+    stats = get_dashboard_stats()
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Candidates", len(candidates))
+        st.metric("Total Candidates", stats['total_candidates'])
     
     with col2:
-        st.metric("Active Jobs", len([j for j in jobs if j.get('status') == 'active']))
+        st.metric("Active Jobs", stats['active_jobs'])
     
     with col3:
-        st.metric("Scheduled Interviews", len([i for i in interviews if i.get('status') == 'scheduled']))
+        st.metric("Scheduled Interviews", stats['scheduled_interviews'])
     
     with col4:
-        st.metric("Pending Reviews", len([c for c in candidates if c.get('status') == 'new']))
+        st.metric("Pending Reviews", stats['pending_reviews'])
+
+def show_dashboard():
+    """Show dashboard with system overview"""
+    st.header("📊 Dashboard")
+    
+    show_dashboard_metrics()
     
     st.subheader("Recent Activity")
     
@@ -136,17 +370,17 @@ def show_job_management():
                     id=generate_id(),
                     title=job_title,
                     description=job_description,
-                    requirements=requirements_input.split(',') if requirements_input else [],
-                    skills_required=skills_input.split(',') if skills_input else [],
+                    requirements=parse_csv_list(requirements_input),
+                    skills_required=parse_csv_list(skills_input),
                     experience_level=experience_level,
                     department=department,
                     created_at=get_timestamp()
                 )
                 
-                store_keeper = st.session_state.agents['store_keeper']
-                result = store_keeper.store_job(job.to_dict())
+                result = get_store_keeper().store_job(job.to_dict())
                 
                 if result['success']:
+                    bump_store_version('jobs')
                     st.success("Job created successfully!")
                     st.session_state.current_job = job.to_dict()
                 else:
@@ -155,17 +389,16 @@ def show_job_management():
     with tab2:
         st.subheader("Existing Jobs")
         
-        store_keeper = st.session_state.agents['store_keeper']
-        jobs = store_keeper.get_jobs()
+        jobs = get_jobs()
         
         if jobs:
-            jobs_df = pd.DataFrame(jobs)
-            st.dataframe(jobs_df, use_container_width=True)
+            jobs_by_id = {j['id']: j for j in jobs}
+            show_table('jobs', key="jobs_page")
             
             if st.button("Edit Selected Job"):
-                selected_job_id = st.selectbox("Select Job to Edit", [j['id'] for j in jobs])
+                selected_job_id = st.selectbox("Select Job to Edit", list(jobs_by_id))
                 if selected_job_id:
-                    selected_job = next((j for j in jobs if j['id'] == selected_job_id), None)
+                    selected_job = jobs_by_id.get(selected_job_id)
                     if selected_job:
                         st.session_state.current_job = selected_job
                         st.experimental_rerun()
@@ -176,20 +409,19 @@ def show_resume_collection():
     """Show resume collection interface"""
     st.header("📄 Resume Collection")
     
-    resume_bot = st.session_state.agents['resume_bot']
-    
     tab1, tab2 = st.tabs(["Upload Resume", "Collected Resumes"])
     
     with tab1:
         st.subheader("Upload New Resume")
         
-        store_keeper = st.session_state.agents['store_keeper']
-        jobs = store_keeper.get_jobs()
+        jobs = get_jobs()
         
         if jobs:
-            selected_job = st.selectbox(
+            jobs_by_id = {j['id']: j for j in jobs}
+            selected_job_id = st.selectbox(
                 "Select Job Position",
-                options=[j['title'] for j in jobs],
+                options=list(jobs_by_id),
+                format_func=lambda job_id: jobs_by_id[job_id]['title'],
                 help="Choose the job position this resume is for"
             )
             
@@ -205,12 +437,13 @@ def show_resume_collection():
                 if st.button("Process Resume"):
                     with st.spinner("Processing resume..."):
                         try:
-                            job_data = next((j for j in jobs if j['title'] == selected_job), None)
+                            job_data = jobs_by_id.get(selected_job_id)
                             
                             # Save uploaded file
                             file_path = f"data/resumes/{uploaded_file.name}"
-                            with open(file_path, "wb") as f:
-                                f.write(uploaded_file.getbuffer())
+                            uploaded_file.seek(0)
+                            with open(file_path, "wb", buffering=UPLOAD_CHUNK_SIZE) as f:
+                                shutil.copyfileobj(uploaded_file, f, length=UPLOAD_CHUNK_SIZE)
                             
                             # Prepare resume data
                             resume_data = {
@@ -219,7 +452,7 @@ def show_resume_collection():
                                 'job_data': job_data
                             }
                             
-                            result = resume_bot.process_resume(resume_data)
+                            result = get_resume_bot().process_resume(resume_data)
                             
                             if result['success']:
                                 st.success("Resume processed successfully!")
@@ -251,8 +484,9 @@ def show_resume_collection():
                                     created_at=get_timestamp()
                                 )
                                 
-                                store_result = store_keeper.store_candidate(candidate.to_dict())
+                                store_result = get_store_keeper().store_candidate(candidate.to_dict())
                                 if store_result['success']:
+                                    bump_store_version('candidates')
                                     st.success("Candidate stored successfully!")
                                 else:
                                     st.error(f"Error storing candidate: {store_result['message']}")
@@ -267,17 +501,16 @@ def show_resume_collection():
     with tab2:
         st.subheader("Collected Resumes")
         
-        store_keeper = st.session_state.agents['store_keeper']
-        candidates = store_keeper.get_candidates()
+        candidates = get_candidates()
         
         if candidates:
-            candidates_df = pd.DataFrame(candidates)
-            st.dataframe(candidates_df, use_container_width=True)
+            candidates_by_id = {c['id']: c for c in candidates}
+            show_table('candidates', key="candidates_page")
             
             if st.button("View Candidate Details"):
-                selected_candidate_id = st.selectbox("Select Candidate", [c['id'] for c in candidates])
+                selected_candidate_id = st.selectbox("Select Candidate", list(candidates_by_id))
                 if selected_candidate_id:
-                    candidate = next((c for c in candidates if c['id'] == selected_candidate_id), None)
+                    candidate = candidates_by_id.get(selected_candidate_id)
                     if candidate:
                         st.json(candidate)
         else:
@@ -287,11 +520,8 @@ def show_candidate_filtering():
     """Show candidate filtering interface"""
     st.header("🔍 Candidate Filtering")
     
-    filter_ai = st.session_state.agents['filter_ai']
-    store_keeper = st.session_state.agents['store_keeper']
-    
-    jobs = store_keeper.get_jobs()
-    candidates = store_keeper.get_candidates()
+    jobs = get_jobs()
+    candidates = get_candidates()
     
     if not jobs:
         st.warning("No jobs available. Please create a job first.")
@@ -301,15 +531,18 @@ def show_candidate_filtering():
         st.warning("No candidates available. Please upload resumes first.")
         return
     
-    selected_job = st.selectbox(
+    jobs_by_id = {j['id']: j for j in jobs}
+    selected_job_id = st.selectbox(
         "Select Job Position",
-        options=[j['title'] for j in jobs],
+        options=list(jobs_by_id),
+        format_func=lambda job_id: jobs_by_id[job_id]['title'],
         help="Choose the job position to filter candidates for"
     )
     
-    job_data = next((j for j in jobs if j['title'] == selected_job), None)
+    job_data = jobs_by_id.get(selected_job_id)
     
     if job_data:
+        selected_job = job_data['title']
         job_candidates = [c for c in candidates if c.get('job_id') == job_data['id']]
         
         if job_candidates:
@@ -343,7 +576,7 @@ def show_candidate_filtering():
                         'score_threshold': score_threshold
                     }
                     
-                    result = filter_ai.filter_candidates(job_candidates, job_data, filter_criteria)
+                    result = filter_job_candidates(job_data['id'], filter_criteria)
                     
                     if result['success']:
                         filtered_candidates = result['filtered_candidates']
@@ -355,14 +588,12 @@ def show_candidate_filtering():
                             filtered_df = pd.DataFrame(filtered_candidates)
                             st.dataframe(filtered_df, use_container_width=True)
                             
-                            if st.button("Export Filtered Candidates"):
-                                csv = filtered_df.to_csv(index=False)
-                                st.download_button(
-                                    label="Download CSV",
-                                    data=csv,
-                                    file_name=f"filtered_candidates_{selected_job}.csv",
-                                    mime="text/csv"
-                                )
+                            st.download_button(
+                                label="Export Filtered Candidates",
+                                data=export_filtered_csv(job_data['id'], filter_criteria),
+                                file_name=f"filtered_candidates_{selected_job}.csv",
+                                mime="text/csv"
+                            )
                         else:
                             st.info("No candidates match the specified criteria.")
                     else:
@@ -374,23 +605,21 @@ def show_interview_scheduling():
     """Show interview scheduling interface"""
     st.header("📅 Interview Scheduling")
     
-    time_bot = st.session_state.agents['time_bot']
-    store_keeper = st.session_state.agents['store_keeper']
-    
     tab1, tab2 = st.tabs(["Schedule Interview", "Manage Interviews"])
     
     with tab1:
         st.subheader("Schedule New Interview")
         
-        candidates = store_keeper.get_candidates()
+        labels, candidates_by_label = get_candidate_choices()
         
-        if candidates:
+        if labels:
             selected_candidate = st.selectbox(
                 "Select Candidate",
-                options=[f"{c['name']} ({c['email']})" for c in candidates]
+                options=labels,
+                key="schedule_candidate_pick"
             )
             
-            candidate_data = next((c for c in candidates if f"{c['name']} ({c['email']})" == selected_candidate), None)
+            candidate_data = candidates_by_label.get(selected_candidate)
             
             if candidate_data:
                 with st.form("interview_form"):
@@ -421,21 +650,18 @@ def show_interview_scheduling():
                             created_at=get_timestamp()
                         )
                         
-                        # Store the interview directly since we already have the Interview object
-                        store_result = store_keeper.store_interview(interview.to_dict())
+                        store_result = get_store_keeper().store_interview(interview.to_dict())
                         
                         if store_result['success']:
+                            bump_store_version('interviews')
                             st.success("Interview scheduled successfully!")
                             
-                            notify_bot = st.session_state.agents['notify_bot']
-                            notify_result = notify_bot.send_interview_notification(
+                            notify_bot = get_notify_bot()
+                            queue_notification(
+                                notify_bot.send_interview_notification,
                                 candidate_data, interview.to_dict()
                             )
-                            
-                            if notify_result['success']:
-                                st.info("Notification sent to candidate.")
-                            else:
-                                st.warning("Interview scheduled but notification failed.")
+                            st.info("Notification queued for candidate.")
                         else:
                             st.error(f"Error storing interview: {store_result['message']}")
         else:
@@ -444,16 +670,16 @@ def show_interview_scheduling():
     with tab2:
         st.subheader("Scheduled Interviews")
         
-        interviews = store_keeper.get_interviews()
+        interviews = get_interviews()
         
         if interviews:
-            interviews_df = pd.DataFrame(interviews)
-            st.dataframe(interviews_df, use_container_width=True)
+            interviews_by_id = {i['id']: i for i in interviews}
+            show_table('interviews', key="interviews_page")
             
             if st.button("Manage Interview"):
-                selected_interview_id = st.selectbox("Select Interview", [i['id'] for i in interviews])
+                selected_interview_id = st.selectbox("Select Interview", list(interviews_by_id))
                 if selected_interview_id:
-                    interview = next((i for i in interviews if i['id'] == selected_interview_id), None)
+                    interview = interviews_by_id.get(selected_interview_id)
                     if interview:
                         st.json(interview)
                         
@@ -464,8 +690,9 @@ def show_interview_scheduling():
                         
                         if st.button("Update Status"):
                             interview['status'] = new_status
-                            result = store_keeper.update_interview(interview)
+                            result = get_store_keeper().update_interview(interview)
                             if result['success']:
+                                bump_store_version('interviews')
                                 st.success("Interview status updated!")
                             else:
                                 st.error(f"Error updating interview: {result['message']}")
@@ -476,26 +703,26 @@ def show_hr_interface():
     """Show HR interface"""
     st.header("👥 HR Interface")
     
-    hr_bridge = st.session_state.agents['hr_bridge']
-    store_keeper = st.session_state.agents['store_keeper']
+    hr_bridge = get_hr_bridge()
     
     tab1, tab2, tab3 = st.tabs(["Candidate Review", "Interview Feedback", "Final Decision"])
     
     with tab1:
         st.subheader("Candidate Review")
         
-        candidates = store_keeper.get_candidates()
+        candidates = get_candidates()
         
         if candidates:
-            pending_candidates = [c for c in candidates if c.get('status') == 'new']
+            pending_labels, pending_by_label = get_candidate_choices(status='new')
             
-            if pending_candidates:
+            if pending_labels:
                 selected_candidate = st.selectbox(
                     "Select Candidate for Review",
-                    options=[f"{c['name']} ({c['email']})" for c in pending_candidates]
+                    options=pending_labels,
+                    key="review_candidate_pick"
                 )
                 
-                candidate_data = next((c for c in pending_candidates if f"{c['name']} ({c['email']})" == selected_candidate), None)
+                candidate_data = pending_by_label.get(selected_candidate)
                 
                 if candidate_data:
                     st.subheader("Candidate Information")
@@ -536,7 +763,8 @@ def show_hr_interface():
                                 st.success("Review submitted successfully!")
                                 candidate_data['status'] = decision
                                 candidate_data['review'] = review_data
-                                store_keeper.update_candidate(candidate_data)
+                                get_store_keeper().update_candidate(candidate_data)
+                                bump_store_version('candidates')
                             else:
                                 st.error(f"Error submitting review: {result['message']}")
             else:
@@ -547,19 +775,21 @@ def show_hr_interface():
     with tab2:
         st.subheader("Interview Feedback")
         
-        interviews = store_keeper.get_interviews()
-        completed_interviews = [i for i in interviews if i.get('status') == 'completed']
+        completed_labels, completed_by_label = get_interview_choices(status='completed')
         
-        if completed_interviews:
+        if completed_labels:
             selected_interview = st.selectbox(
                 "Select Interview for Feedback",
-                options=[f"Interview {i['id'][:8]}..." for i in completed_interviews]
+                options=completed_labels,
+                key="feedback_interview_pick"
             )
             
-            interview_data = next((i for i in completed_interviews if f"Interview {i['id'][:8]}..." == selected_interview), None)
+            interview_data = completed_by_label.get(selected_interview)
             
             if interview_data:
-                st.json(interview_data)
+                st.write("**Interviewer:**", interview_data.get('interviewer', 'N/A'))
+                st.write("**Scheduled Time:**", interview_data.get('scheduled_time', 'N/A'))
+                show_raw_json(interview_data, key="feedback_raw_json")
                 
                 with st.form("feedback_form"):
                     technical_rating = st.slider("Technical Skills", 1, 10, 5)
@@ -589,7 +819,8 @@ def show_hr_interface():
                         if result['success']:
                             st.success("Feedback submitted successfully!")
                             interview_data['feedback'] = feedback_data
-                            store_keeper.update_interview(interview_data)
+                            get_store_keeper().update_interview(interview_data)
+                            bump_store_version('interviews')
                         else:
                             st.error(f"Error submitting feedback: {result['message']}")
         else:
@@ -598,27 +829,35 @@ def show_hr_interface():
     with tab3:
         st.subheader("Final Decision")
         
-        candidates = store_keeper.get_candidates()
-        interviews = store_keeper.get_interviews()
+        decision_labels, candidates_with_interviews = get_interviewed_candidate_choices()
         
-        candidates_with_interviews = []
-        for candidate in candidates:
-            candidate_interviews = [i for i in interviews if i.get('candidate_id') == candidate['id']]
-            if candidate_interviews:
-                candidate['interviews'] = candidate_interviews
-                candidates_with_interviews.append(candidate)
-        
-        if candidates_with_interviews:
+        if decision_labels:
             selected_candidate = st.selectbox(
                 "Select Candidate for Final Decision",
-                options=[f"{c['name']} ({c['email']})" for c in candidates_with_interviews]
+                options=decision_labels,
+                key="decision_candidate_pick"
             )
             
-            candidate_data = next((c for c in candidates_with_interviews if f"{c['name']} ({c['email']})" == selected_candidate), None)
+            candidate_data = candidates_with_interviews.get(selected_candidate)
             
             if candidate_data:
                 st.subheader("Candidate Summary")
-                st.json(candidate_data)
+                
+                candidate_interviews = candidate_data['interviews']
+                latest_interview = max(candidate_interviews, key=lambda i: i.get('scheduled_time', ''))
+                job = {j['id']: j for j in get_jobs()}.get(candidate_data.get('job_id'), {})
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write("**Name:**", candidate_data.get('name', 'N/A'))
+                    st.write("**Email:**", candidate_data.get('email', 'N/A'))
+                    st.write("**Job:**", job.get('title', 'N/A'))
+                
+                with col2:
+                    st.write("**Interviews:**", len(candidate_interviews))
+                    st.write("**Latest Interview Status:**", latest_interview.get('status', 'N/A'))
+                
+                show_raw_json(candidate_data, key="decision_raw_json")
                 
                 with st.form("final_decision_form"):
                     final_decision = st.selectbox(
@@ -644,87 +883,79 @@ def show_hr_interface():
                         if result['success']:
                             st.success("Final decision submitted successfully!")
                             
-                            notify_bot = st.session_state.agents['notify_bot']
-                            notify_result = notify_bot.send_decision_notification(
+                            notify_bot = get_notify_bot()
+                            queue_notification(
+                                notify_bot.send_decision_notification,
                                 candidate_data, decision_data
                             )
-                            
-                            if notify_result['success']:
-                                st.info("Notification sent to candidate.")
-                            else:
-                                st.warning("Decision recorded but notification failed.")
+                            st.info("Notification queued for candidate.")
                         else:
                             st.error(f"Error submitting decision: {result['message']}")
         else:
             st.info("No candidates with completed interviews available.")
 
-def show_analytics():
-    """Show analytics and reports"""
-    st.header("📈 Analytics")
-    
-    store_keeper = st.session_state.agents['store_keeper']
-    
-    candidates = store_keeper.get_candidates()
-    jobs = store_keeper.get_jobs()
-    interviews = store_keeper.get_interviews()
-    
-    if not candidates and not jobs and not interviews:
-        st.info("No data available for analytics.")
-        return
-    
-    st.subheader("Overview Metrics")
+@st.fragment
+def show_overview_metrics():
+    """Show analytics overview metric columns"""
+    stats = get_dashboard_stats()
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Candidates", len(candidates))
+        st.metric("Total Candidates", stats['total_candidates'])
     
     with col2:
-        st.metric("Total Jobs", len(jobs))
+        st.metric("Total Jobs", stats['total_jobs'])
     
     with col3:
-        st.metric("Total Interviews", len(interviews))
+        st.metric("Total Interviews", stats['total_interviews'])
     
     with col4:
-        hired_count = len([c for c in candidates if c.get('final_decision', {}).get('decision') == 'hire'])
-        st.metric("Hired Candidates", hired_count)
+        st.metric("Hired Candidates", stats['hired'])
+
+def show_analytics():
+    """Show analytics and reports"""
+    st.header("📈 Analytics")
+    
+    candidates = get_candidates()
+    jobs = get_jobs()
+    interviews = get_interviews()
+    
+    if not candidates and not jobs and not interviews:
+        st.info("No data available for analytics.")
+        return
+    
+    st.subheader("Overview Metrics")
+    show_overview_metrics()
     
     if candidates:
         st.subheader("Candidate Status Distribution")
-        
-        status_counts = {}
-        for candidate in candidates:
-            status = candidate.get('status', 'unknown')
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        if status_counts:
-            chart_data = pd.DataFrame(
-                list(status_counts.items()),
-                columns=['Status', 'Count']
-            )
-            st.bar_chart(chart_data.set_index('Status'))
+        show_count_chart('candidates', 'status', 'unknown', 'Status')
     
     if jobs:
         st.subheader("Jobs by Department")
-        
-        dept_counts = {}
-        for job in jobs:
-            dept = job.get('department', 'Unknown')
-            dept_counts[dept] = dept_counts.get(dept, 0) + 1
-        
-        if dept_counts:
-            chart_data = pd.DataFrame(
-                list(dept_counts.items()),
-                columns=['Department', 'Count']
-            )
-            st.bar_chart(chart_data.set_index('Department'))
+        show_count_chart('jobs', 'department', 'Unknown', 'Department')
     
     st.subheader("Detailed Reports")
-    
+    show_report_section()
+
+@st.fragment
+def show_count_chart(kind: str, field: str, default: str, label: str):
+    """Render a bar chart of record counts per field value"""
+    counts = count_field(kind, field, default)
+    if not counts.empty:
+        st.bar_chart(counts.rename_axis(label).to_frame('Count'))
+
+@st.fragment
+def show_report_section():
+    """Generate the recruitment report without rerunning the charts above"""
     if st.button("Generate Recruitment Report"):
         with st.spinner("Generating report..."):
-            report = generate_recruitment_report(candidates, jobs, interviews)
-            st.text_area("Recruitment Report", report, height=400)
+            versions = get_store_versions()
+            report = generate_recruitment_report(
+                versions['candidates'], versions['jobs'], versions['interviews']
+            )
+            st.text_area("Recruitment Report", report.decode('utf-8'), height=400)
             
             st.download_button(
                 label="Download Report",
@@ -733,61 +964,56 @@ def show_analytics():
                 mime="text/plain"
             )
 
-def generate_recruitment_report(candidates, jobs, interviews):
-    """Generate a comprehensive recruitment report"""
-    report = []
-    report.append("RECRUITMENT REPORT")
-    report.append("=" * 50)
-    report.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("")
-    
-    report.append("SUMMARY")
-    report.append("-" * 20)
-    report.append(f"Total Candidates: {len(candidates)}")
-    report.append(f"Total Jobs: {len(jobs)}")
-    report.append(f"Total Interviews: {len(interviews)}")
-    report.append("")
-    
-    if candidates:
-        report.append("CANDIDATE ANALYSIS")
-        report.append("-" * 20)
-        
-        status_counts = {}
-        for candidate in candidates:
-            status = candidate.get('status', 'unknown')
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        for status, count in status_counts.items():
-            report.append(f"{status.title()}: {count}")
+def generate_recruitment_report(candidates_version: int, jobs_version: int,
+                                interviews_version: int) -> bytes:
+    """Generate a comprehensive recruitment report as UTF-8 text"""
+    # Only the body is cached, so the header always shows the current time
+    header = (
+        "RECRUITMENT REPORT\n"
+        + "=" * 50 + "\n"
+        + f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    )
+    return header.encode('utf-8') + _report_body(candidates_version, jobs_version, interviews_version)
+
+@st.cache_data(ttl=300, max_entries=16)
+def _report_body(candidates_version: int, jobs_version: int, interviews_version: int) -> bytes:
+    candidates = get_records_frame('candidates')
+    jobs = get_records_frame('jobs')
+    interviews = get_records_frame('interviews')
+    
+    report = io.StringIO()
+    report.write("SUMMARY\n")
+    report.write("-" * 20 + "\n")
+    report.write(f"Total Candidates: {len(candidates)}\n"
+                 f"Total Jobs: {len(jobs)}\n"
+                 f"Total Interviews: {len(interviews)}\n\n")
+    
+    if not candidates.empty:
+        report.write("CANDIDATE ANALYSIS\n")
+        report.write("-" * 20 + "\n")
         
-        report.append("")
+        status_counts = count_field('candidates', 'status', 'unknown')
+        report.write("".join(f"{status.title()}: {count}\n" for status, count in status_counts.items()))
+        report.write("\n")
     
-    if jobs:
-        report.append("JOB ANALYSIS")
-        report.append("-" * 20)
-
-        dept_counts = {}
-        for job in jobs:
-            dept = job.get('department', 'Unknown')
-            dept_counts[dept] = dept_counts.get(dept, 0) + 1
-
-        for dept, count in dept_counts.items():
-            report.append(f"{dept}: {count} jobs")
-        report.append("")
+    if not jobs.empty:
+        report.write("JOB ANALYSIS\n")
+        report.write("-" * 20 + "\n")
 
-    if interviews:
-        report.append("INTERVIEW SUMMARY")
-        report.append("-" * 20)
+        dept_counts = count_field('jobs', 'department', 'Unknown')
+        report.write("".join(f"{dept}: {count} jobs\n" for dept, count in dept_counts.items()))
+        report.write("\n")
 
-        interview_status_counts = {}
-        for interview in interviews:
-            status = interview.get('status', 'scheduled')
-            interview_status_counts[status] = interview_status_counts.get(status, 0) + 1
+    if not interviews.empty:
+        report.write("INTERVIEW SUMMARY\n")
+        report.write("-" * 20 + "\n")
 
-        for status, count in interview_status_counts.items():
-            report.append(f"{status.title()}: {count}")
+        interview_status_counts = count_field('interviews', 'status', 'scheduled')
+        report.write("".join(f"{status.title()}: {count}\n"
+                             for status, count in interview_status_counts.items()))
 
-    return "\n".join(report)
+    # Every line was written with a newline; the report ends without one
+    return report.getvalue()[:-1].encode('utf-8')
 
 
 if __name__ == "__main__":
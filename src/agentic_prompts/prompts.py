@@ -42,9 +42,10 @@ Scoring criteria:
 
 Current context: {context}
 Job requirements: {job_requirements}
-Candidates to analyze: {candidates}
+Candidates to analyze (JSON array): {candidates}
 
-Provide detailed analysis and rankings.
+Provide detailed analysis and rankings. Respond with a JSON array holding one object
+per candidate with the keys "candidate_id", "score", "ranking" and "reasoning".
 """
 
 STORE_KEEPER_PROMPT = """
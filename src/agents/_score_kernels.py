@@ -0,0 +1,20 @@
+"""
+Vectorized scoring kernels for FilterAI batch ranking
+"""
+
+import numpy as np
+
+def experience_scores(candidate_years: np.ndarray, required_years: int) -> np.ndarray:
+    """Bucket candidate years against the required years"""
+    return np.select(
+        [candidate_years >= required_years,
+         candidate_years >= required_years * 0.8,
+         candidate_years >= required_years * 0.6],
+        [100.0, 80.0, 60.0],
+        default=30.0
+    )
+
+def overall_scores(skill_scores: np.ndarray, experience_scores: np.ndarray,
+                   education_scores: np.ndarray) -> np.ndarray:
+    """Combine the component scores with the FilterAI weights"""
+    return (skill_scores * 0.4) + (experience_scores * 0.3) + (education_scores * 0.2) + (10 * 0.1)
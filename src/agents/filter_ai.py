@@ -2,36 +2,113 @@
 FilterAI agent for candidate filtering and ranking
 """
 
+import re
+import sys
+from bisect import bisect_right
+from functools import cached_property, lru_cache
 from typing import Dict, List, Any, Optional
-from langchain.schema import HumanMessage, AIMessage
-from src.models.llm_config import llm_config
+import numpy as np
 from src.agentic_prompts.prompts import FILTER_AI_PROMPT
+from src.agents._score_kernels import experience_scores, overall_scores
 import json
 
+ANALYSIS_CACHE_SIZE = 4096
+
+# Score cut-offs and the ranking category for each band between them
+_RANK_CUTOFFS = (40, 60, 80)
+_RANK_LABELS = ("Below Average", "Average", "Good", "Excellent")
+
+_EDU_KEYWORDS = ['bachelor', 'master', 'phd', 'degree', 'university', 'college']
+# Lookahead so overlapping keywords are all found, like the per-keyword substring test
+_EDU_KEYWORDS_RE = re.compile(r'(?=(%s))' % '|'.join(_EDU_KEYWORDS))
+
+_YEARS_RE = re.compile(r'(\d+)\s*years?', re.IGNORECASE)
+
+SKILL_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=SKILL_CACHE_SIZE)
+def _norm_skill(skill: str) -> str:
+    """Lowercase a skill name, reusing one interned string per recently seen spelling"""
+    return sys.intern(skill.lower())
+
+@lru_cache(maxsize=1024)
+def _years_in(text: str) -> int:
+    match = _YEARS_RE.search(text)
+    return int(match.group(1)) if match else 0
+
+def _overlay(candidate: Dict[str, Any], score: float, ranking: str,
+             recommendations: List[str]) -> Dict[str, Any]:
+    """Merge the filter results into a copy of a candidate"""
+    merged = dict(candidate)
+    merged['match_score'] = score
+    merged['ranking'] = ranking
+    merged['recommendations'] = recommendations
+    return merged
+
 class FilterAI:
     """FilterAI agent for candidate analysis and filtering"""
     
     def __init__(self):
-        self.llm = llm_config.get_llm()
         self.name = "FilterAI"
+        self._analysis_cache: Dict[tuple, Dict[str, Any]] = {}
+    
+    @cached_property
+    def llm(self):
+        """Get the shared LLM, created only when first used"""
+        from src.models.llm_config import llm_config
+        return llm_config.get_llm()
     
-    def analyze_candidate(self, candidate: Dict[str, Any], job: Dict[str, Any]) -> Dict[str, Any]:
+    def _analysis_key(self, candidate: Dict[str, Any], job: Dict[str, Any]) -> tuple:
+        """Build a cache key from every field the analysis reads"""
+        return (
+            candidate.get('id'), tuple(candidate.get('skills', [])),
+            candidate.get('experience', ''), candidate.get('education', ''),
+            job.get('id'), tuple(job.get('skills_required', [])),
+            job.get('experience_level', ''), tuple(job.get('requirements', []))
+        )
+    
+    def analyze_candidate(self, candidate: Dict[str, Any], job: Dict[str, Any],
+                          scores: Optional[tuple] = None) -> Dict[str, Any]:
         """Analyze a single candidate against job requirements"""
         try:
-            # Calculate skill match score
-            skill_score = self._calculate_skill_match(candidate.get('skills', []), 
-                                                    job.get('skills_required', []))
-            
-            # Calculate experience match score
-            exp_score = self._calculate_experience_match(candidate.get('experience', ''), 
-                                                       job.get('experience_level', ''))
-            
-            # Calculate education match score
-            edu_score = self._calculate_education_match(candidate.get('education', ''), 
-                                                       job.get('requirements', []))
-            
-            # Calculate overall score
-            overall_score = (skill_score * 0.4) + (exp_score * 0.3) + (edu_score * 0.2) + (10 * 0.1)
+            key = self._analysis_key(candidate, job)
+            hash(key)
+        except TypeError:
+            return self._analyze_candidate(candidate, job, scores)
+        
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            analysis = self._analyze_candidate(candidate, job, scores)
+            if 'error' in analysis:
+                return analysis
+            if len(self._analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.clear()
+            self._analysis_cache[key] = analysis
+        
+        return dict(analysis, recommendations=list(analysis['recommendations']))
+    
+    def _analyze_candidate(self, candidate: Dict[str, Any], job: Dict[str, Any],
+                           scores: Optional[tuple] = None) -> Dict[str, Any]:
+        """Score a candidate against job requirements without caching"""
+        try:
+            if scores is not None:
+                # Use the (skill, experience, education, overall) scores from batch ranking
+                skill_score, exp_score, edu_score, overall_score = scores
+            else:
+                # Calculate skill match score
+                skill_score = self._calculate_skill_match(candidate.get('skills', []), 
+                                                        job.get('skills_required', []))
+                
+                # Calculate experience match score
+                exp_score = self._calculate_experience_match(candidate.get('experience', ''), 
+                                                           job.get('experience_level', ''))
+                
+                # Calculate education match score
+                edu_score = self._calculate_education_match(candidate.get('education', ''), 
+                                                           job.get('requirements', []))
+                
+                # Calculate overall score
+                overall_score = (skill_score * 0.4) + (exp_score * 0.3) + (edu_score * 0.2) + (10 * 0.1)
             
             analysis = {
                 "candidate_id": candidate.get('id'),
@@ -50,21 +127,27 @@ class FilterAI:
             return {"error": f"Error analyzing candidate: {str(e)}"}
     
     def rank_candidates(self, candidates: List[Dict[str, Any]], 
-                       job: Dict[str, Any]) -> List[Dict[str, Any]]:
+                       job: Dict[str, Any],
+                       prepared: Optional[List[Optional[tuple]]] = None) -> List[Dict[str, Any]]:
         """Rank all candidates for a job"""
         try:
             analyzed_candidates = []
+            if prepared is None:
+                prepared = self._prepare_candidates(candidates)
+            batch_scores = self._batch_scores(candidates, job, prepared)
             
-            for candidate in candidates:
-                analysis = self.analyze_candidate(candidate, job)
+            for candidate, scores in zip(candidates, batch_scores):
+                analysis = self.analyze_candidate(candidate, job, scores)
                 if 'error' not in analysis:
                     analysis['candidate_data'] = candidate
                     analyzed_candidates.append(analysis)
             
-            # Sort by overall score in descending order
-            analyzed_candidates.sort(key=lambda x: x['overall_score'], reverse=True)
+            # Sort by overall score in descending order, keeping ties in input order
+            scores = np.fromiter((a['overall_score'] for a in analyzed_candidates),
+                                 dtype=np.float64, count=len(analyzed_candidates))
+            order = np.argsort(-scores, kind='stable')
             
-            return analyzed_candidates
+            return [analyzed_candidates[i] for i in order]
             
         except Exception as e:
             return [{"error": f"Error ranking candidates: {str(e)}"}]
@@ -75,11 +158,75 @@ class FilterAI:
         if not required_skills:
             return 50.0
         
-        candidate_skills_lower = [skill.lower() for skill in candidate_skills]
-        required_skills_lower = [skill.lower() for skill in required_skills]
+        candidate_skills_lower = frozenset(_norm_skill(skill) for skill in candidate_skills)
         
-        matches = sum(1 for skill in required_skills_lower if skill in candidate_skills_lower)
-        return (matches / len(required_skills_lower)) * 100
+        matches = sum(1 for skill in required_skills if _norm_skill(skill) in candidate_skills_lower)
+        return (matches / len(required_skills)) * 100
+    
+    def _prepare_candidates(self, candidates: List[Dict[str, Any]]) -> List[Optional[tuple]]:
+        """Lowercase skills and parse years once per candidate, None for malformed records"""
+        prepared = []
+        for candidate in candidates:
+            try:
+                prepared.append((
+                    frozenset(_norm_skill(skill) for skill in candidate.get('skills', [])),
+                    self._extract_years(candidate.get('experience', ''))
+                ))
+            except (AttributeError, TypeError):
+                prepared.append(None)
+        return prepared
+    
+    def _batch_scores(self, candidates: List[Dict[str, Any]], job: Dict[str, Any],
+                      prepared: List[Optional[tuple]]) -> List[Optional[tuple]]:
+        """Calculate (skill, experience, education, overall) scores for all candidates at once"""
+        if None in prepared:
+            # Leave malformed records to the per-candidate path, which reports the error
+            return [None] * len(candidates)
+        
+        skill_scores = self._skill_match_scores([skills for skills, _ in prepared],
+                                                job.get('skills_required', []))
+        if None in skill_scores:
+            return [None] * len(candidates)
+        
+        try:
+            requirements = job.get('requirements', [])
+            edu_scores = [self._calculate_education_match(c.get('education', ''), requirements)
+                          for c in candidates]
+            
+            required_exp = job.get('experience_level', '')
+            if required_exp:
+                candidate_years = np.fromiter((years for _, years in prepared),
+                                              dtype=np.int64, count=len(candidates))
+                exp_scores = experience_scores(candidate_years, self._extract_years(required_exp))
+            else:
+                exp_scores = np.full(len(candidates), 50.0)
+        except (AttributeError, TypeError):
+            return [None] * len(candidates)
+        
+        overall = overall_scores(np.asarray(skill_scores, dtype=np.float64), exp_scores,
+                                 np.asarray(edu_scores, dtype=np.float64))
+        return list(zip(skill_scores, exp_scores.tolist(), edu_scores, overall.tolist()))
+    
+    def _skill_match_scores(self, candidate_skills: List[frozenset], 
+                            required_skills: List[str]) -> List[Optional[float]]:
+        """Calculate skill match percentages for many candidates with one matrix product"""
+        if not required_skills:
+            return [50.0] * len(candidate_skills)
+        
+        try:
+            required_skills_lower = [_norm_skill(skill) for skill in required_skills]
+            skill_index = {skill: i for i, skill in enumerate(dict.fromkeys(required_skills_lower))}
+            weights = np.bincount([skill_index[skill] for skill in required_skills_lower],
+                                  minlength=len(skill_index))
+            
+            incidence = np.zeros((len(candidate_skills), len(skill_index)), dtype=np.uint8)
+            for row, skills in enumerate(candidate_skills):
+                incidence[row, [skill_index[s] for s in skills if s in skill_index]] = 1
+            matches = incidence @ weights
+        except (AttributeError, TypeError):
+            return [None] * len(candidate_skills)
+        
+        return [(int(m) / len(required_skills_lower)) * 100 for m in matches]
     
     def _calculate_experience_match(self, candidate_exp: str, required_exp: str) -> float:
         """Calculate experience match score"""
@@ -104,36 +251,21 @@ class FilterAI:
         if not requirements:
             return 50.0
         
-        edu_keywords = ['bachelor', 'master', 'phd', 'degree', 'university', 'college']
         candidate_edu_lower = candidate_edu.lower() if candidate_edu else ''
         
-        education_score = 0
-        for keyword in edu_keywords:
-            if keyword in candidate_edu_lower:
-                education_score += 20
-        
-        return min(education_score, 100.0)
+        keywords_found = set(_EDU_KEYWORDS_RE.findall(candidate_edu_lower))
+        return min(len(keywords_found) * 20, 100.0)
     
     def _extract_years(self, text: str) -> int:
         """Extract years from text"""
-        import re
         if not text:
             return 0
         
-        pattern = r'(\d+)\s*years?'
-        matches = re.findall(pattern, text.lower())
-        return int(matches[0]) if matches else 0
+        return _years_in(text)
     
     def _get_ranking_category(self, score: float) -> str:
         """Get ranking category based on score"""
-        if score >= 80:
-            return "Excellent"
-        elif score >= 60:
-            return "Good"
-        elif score >= 40:
-            return "Average"
-        else:
-            return "Below Average"
+        return _RANK_LABELS[bisect_right(_RANK_CUTOFFS, score)]
     
     def _generate_recommendations(self, candidate: Dict[str, Any], 
                                 job: Dict[str, Any], score: float) -> List[str]:
@@ -155,17 +287,63 @@ class FilterAI:
         
         return recommendations
     
+    def _meets_criteria(self, candidate: Dict[str, Any], prepared: Optional[tuple],
+                        min_experience: int, required_skills: frozenset,
+                        education_level: str) -> bool:
+        """Check the experience, skill and education criteria for one candidate"""
+        if prepared is None:
+            prepared = (None, self._extract_years(candidate.get('experience', '')))
+        candidate_skills, candidate_years = prepared
+        
+        # Check minimum experience
+        if candidate_years < min_experience:
+            return False
+        
+        # Check required skills
+        if required_skills:
+            if candidate_skills is None:
+                candidate_skills = frozenset(_norm_skill(skill) for skill in candidate.get('skills', []))
+            if not required_skills.issubset(candidate_skills):
+                return False
+        
+        # Check education level
+        if education_level != 'Any':
+            candidate_edu = candidate.get('education', '').lower()
+            if education_level.lower() not in candidate_edu:
+                return False
+        
+        return True
+    
     def filter_candidates(self, candidates: List[Dict[str, Any]], 
                          job: Dict[str, Any], 
                          filter_criteria: Dict[str, Any]) -> Dict[str, Any]:
         """Filter candidates based on criteria and job requirements"""
         try:
-            # First rank all candidates
-            ranked_candidates = self.rank_candidates(candidates, job)
+            min_experience = filter_criteria.get('min_experience', 0)
+            required_skills = frozenset(_norm_skill(skill) for skill in filter_criteria.get('required_skills', []))
+            education_level = filter_criteria.get('education_level', 'Any')
+            score_threshold = filter_criteria.get('score_threshold', 0)
             
-            # Apply filter criteria
-            filtered_candidates = []
+            # Apply the cheap criteria first so only survivors are scored
+            pruned_candidates = []
+            pruned_prepared = []
+            for candidate, prepared in zip(candidates, self._prepare_candidates(candidates)):
+                try:
+                    # Rows _prepare_candidates marked malformed (None) are re-read here
+                    if not self._meets_criteria(candidate, prepared, min_experience,
+                                                required_skills, education_level):
+                        continue
+                except (AttributeError, TypeError):
+                    # Ranking drops rows it cannot score; for any other row the error stands
+                    if 'error' in self.analyze_candidate(candidate, job):
+                        continue
+                    raise
+                pruned_candidates.append(candidate)
+                pruned_prepared.append(prepared)
+            
+            ranked_candidates = self.rank_candidates(pruned_candidates, job, pruned_prepared)
             
+            filtered_candidates = []
             for candidate_analysis in ranked_candidates:
                 if 'error' in candidate_analysis:
                     continue
@@ -173,40 +351,16 @@ class FilterAI:
                 candidate = candidate_analysis['candidate_data']
                 score = candidate_analysis['overall_score']
                 
-                # Check minimum experience
-                min_experience = filter_criteria.get('min_experience', 0)
-                candidate_years = self._extract_years(candidate.get('experience', ''))
-                if candidate_years < min_experience:
-                    continue
-                
-                # Check required skills
-                required_skills = filter_criteria.get('required_skills', [])
-                if required_skills:
-                    candidate_skills = [skill.lower() for skill in candidate.get('skills', [])]
-                    required_skills_lower = [skill.lower() for skill in required_skills]
-                    if not all(skill in candidate_skills for skill in required_skills_lower):
-                        continue
-                
-                # Check education level
-                education_level = filter_criteria.get('education_level', 'Any')
-                if education_level != 'Any':
-                    candidate_edu = candidate.get('education', '').lower()
-                    if education_level.lower() not in candidate_edu:
-                        continue
-                
                 # Check minimum score threshold
-                score_threshold = filter_criteria.get('score_threshold', 0)
                 if score < score_threshold:
                     continue
                 
                 # Add candidate to filtered list with analysis data
-                filtered_candidate = candidate.copy()
-                filtered_candidate.update({
-                    'match_score': score,
-                    'ranking': candidate_analysis['ranking'],
-                    'recommendations': candidate_analysis['recommendations']
-                })
-                filtered_candidates.append(filtered_candidate)
+                filtered_candidates.append(_overlay(
+                    candidate, score,
+                    candidate_analysis['ranking'],
+                    candidate_analysis['recommendations']
+                ))
             
             return {
                 "success": True,
@@ -221,4 +375,46 @@ class FilterAI:
                 "success": False,
                 "message": f"Error filtering candidates: {str(e)}",
                 "filtered_candidates": []
-            }
\ No newline at end of file
+            }
+    
+    def review_candidates(self, candidates: List[Dict[str, Any]], job: Dict[str, Any],
+                          context: str = "") -> Dict[str, Any]:
+        """Ask the LLM to review all candidates for a job in a single call"""
+        try:
+            summaries = [{
+                "candidate_id": candidate.get('id'),
+                "skills": candidate.get('skills', []),
+                "experience": candidate.get('experience'),
+                "education": candidate.get('education')
+            } for candidate in candidates]
+            
+            prompt = FILTER_AI_PROMPT.format(
+                context=context,
+                job_requirements=json.dumps({
+                    "title": job.get('title'),
+                    "skills_required": job.get('skills_required', []),
+                    "experience_level": job.get('experience_level'),
+                    "requirements": job.get('requirements', [])
+                }),
+                candidates=json.dumps(summaries)
+            )
+            
+            from langchain.schema import HumanMessage
+            response = self.llm.invoke([HumanMessage(content=prompt)])
+            content = response.content.strip()
+            if content.startswith("```"):
+                content = content.strip("`").removeprefix("json").strip()
+            
+            try:
+                reviews = json.loads(content)
+            except json.JSONDecodeError:
+                reviews = []
+            
+            return {"success": True, "reviews": reviews, "raw_response": response.content}
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Error reviewing candidates: {str(e)}",
+                "reviews": []
+            }
@@ -2,33 +2,84 @@
 HRBridge agent for HR interface
 """
 
-from typing import Dict, List, Any, Optional
-from langchain.schema import HumanMessage, AIMessage
-from src.models.llm_config import llm_config
-from src.agentic_prompts.prompts import HR_BRIDGE_PROMPT
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import cached_property
+from heapq import nlargest
+from itertools import chain
+from typing import Dict, List, Any, Optional, Tuple
+
+# Rating cut-offs and the text for each band between them
+_RATING_CUTOFFS = (4, 6, 8)
+_RATING_RECOMMENDATIONS = ("Do not recommend", "Consider", "Recommend", "Strongly recommend")
+_RATING_INSIGHTS = (
+    "Below average candidate - not recommended",
+    "Average candidate requiring careful consideration",
+    "Good candidate with room for growth",
+    "High potential candidate with strong qualifications"
+)
+
+_FEEDBACK_CUTOFFS = (6, 8)
+_TECHNICAL_INSIGHTS = ("Technical skills need improvement", "Good technical foundation",
+                       "Excellent technical skills")
+_COMMUNICATION_INSIGHTS = ("Communication skills need development", "Adequate communication skills",
+                           "Strong communication abilities")
+_CULTURE_FIT_INSIGHTS = ("Cultural fit concerns", "Good cultural alignment", "Excellent cultural fit")
+
+# Shared default for candidates without candidate_data; never modified
+_EMPTY: Dict[str, Any] = {}
+
+# HR feedback action -> (next action, candidate status)
+_FEEDBACK_ACTIONS = {
+    "approve": ("schedule_interview", "approved"),
+    "reject": ("update_status", "rejected"),
+    "hold": ("update_status", "on_hold")
+}
+
+_NEXT_STEPS = {
+    "approved": ("Schedule interview", "Prepare interview questions", "Notify candidate"),
+    "rejected": ("Send rejection notification", "Update candidate status", "Archive application"),
+    "interview_required": ("Schedule additional screening", "Prepare technical assessment", "Request references")
+}
+_DEFAULT_NEXT_STEPS = ("Review application further", "Request additional information")
+
+@dataclass
+class HRStats:
+    """Candidate statistics gathered in a single pass"""
+    total: int = 0
+    ranking_counts: Counter = field(default_factory=Counter)
+    skill_counts: Counter = field(default_factory=Counter)
 
 class HRBridge:
     """HRBridge agent for HR interactions"""
     
     def __init__(self):
-        self.llm = llm_config.get_llm()
         self.name = "HRBridge"
     
+    @cached_property
+    def llm(self):
+        """Get the shared LLM instance on demand"""
+        from src.models.llm_config import llm_config
+        return llm_config.get_llm()
+    
     def present_candidates(self, candidates: List[Dict[str, Any]], 
                             job: Dict[str, Any]) -> Dict[str, Any]:
         """Present filtered candidates to HR"""
         try:
-            # Prepare candidate summary
-            candidate_summary = self._prepare_candidate_summary(candidates)
+            top_candidates = self._top_candidates(candidates, 5)
+            
+            # Summarize only the candidates being presented
+            candidate_summary = self._prepare_candidate_summary(top_candidates)
             
             # Generate HR presentation
             presentation = {
                 "job_title": job.get("title", "Unknown Position"),
                 "job_id": job.get("id"),
                 "total_candidates": len(candidates),
-                "top_candidates": candidates[:5],  # Top 5 candidates
+                "top_candidates": top_candidates,
                 "candidate_summary": candidate_summary,
-                "recommendations": self._generate_hr_recommendations(candidates)
+                "recommendations": self._generate_hr_recommendations(self._count_rankings(candidates))
             }
             
             return presentation
@@ -39,29 +90,15 @@ class HRBridge:
     def process_hr_feedback(self, feedback: Dict[str, Any]) -> Dict[str, Any]:
         """Process HR feedback and decisions"""
         try:
-            action = feedback.get("action")
-            candidate_id = feedback.get("candidate_id")
-            
-            if action == "approve":
-                return {
-                    "action": "schedule_interview",
-                    "candidate_id": candidate_id,
-                    "status": "approved"
-                }
-            elif action == "reject":
-                return {
-                    "action": "update_status",
-                    "candidate_id": candidate_id,
-                    "status": "rejected"
-                }
-            elif action == "hold":
-                return {
-                    "action": "update_status",
-                    "candidate_id": candidate_id,
-                    "status": "on_hold"
-                }
-            else:
+            next_action = _FEEDBACK_ACTIONS.get(feedback.get("action"))
+            if next_action is None:
                 return {"error": "Invalid action"}
+            
+            return {
+                "action": next_action[0],
+                "candidate_id": feedback.get("candidate_id"),
+                "status": next_action[1]
+            }
                 
         except Exception as e:
             return {"error": f"Error processing HR feedback: {str(e)}"}
@@ -70,6 +107,7 @@ class HRBridge:
                             job: Dict[str, Any]) -> Dict[str, Any]:
         """Generate comprehensive HR report"""
         try:
+            stats = self._aggregate(candidates)
             report = {
                 "job_details": {
                     "title": job.get("title"),
@@ -77,15 +115,15 @@ class HRBridge:
                     "requirements": job.get("requirements", [])
                 },
                 "candidate_statistics": {
-                    "total_candidates": len(candidates),
-                    "excellent_candidates": len([c for c in candidates if c.get("ranking") == "Excellent"]),
-                    "good_candidates": len([c for c in candidates if c.get("ranking") == "Good"]),
-                    "average_candidates": len([c for c in candidates if c.get("ranking") == "Average"]),
-                    "below_average_candidates": len([c for c in candidates if c.get("ranking") == "Below Average"])
+                    "total_candidates": stats.total,
+                    "excellent_candidates": stats.ranking_counts["Excellent"],
+                    "good_candidates": stats.ranking_counts["Good"],
+                    "average_candidates": stats.ranking_counts["Average"],
+                    "below_average_candidates": stats.ranking_counts["Below Average"]
                 },
-                "top_candidates": candidates[:3],
-                "skill_analysis": self._analyze_skills(candidates),
-                "recommendations": self._generate_hiring_recommendations(candidates)
+                "top_candidates": self._top_candidates(candidates, 3),
+                "skill_analysis": self._analyze_skills(stats),
+                "recommendations": self._generate_hiring_recommendations(stats)
             }
             
             return report
@@ -95,27 +133,43 @@ class HRBridge:
     
     def _prepare_candidate_summary(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prepare candidate summary for HR"""
-        summary = []
-        for candidate in candidates:
-            candidate_data = candidate.get("candidate_data", {})
-            summary.append({
-                "id": candidate_data.get("id"),
-                "name": candidate_data.get("name"),
-                "email": candidate_data.get("email"),
-                "skills": candidate_data.get("skills", []),
-                "experience": candidate_data.get("experience"),
-                "overall_score": candidate.get("overall_score"),
-                "ranking": candidate.get("ranking"),
-                "recommendations": candidate.get("recommendations", [])
-            })
-        return summary
+        return [{
+            "id": candidate_data.get("id"),
+            "name": candidate_data.get("name"),
+            "email": candidate_data.get("email"),
+            "skills": candidate_data.get("skills", []),
+            "experience": candidate_data.get("experience"),
+            "overall_score": candidate.get("overall_score"),
+            "ranking": candidate.get("ranking"),
+            "recommendations": candidate.get("recommendations", [])
+        } for candidate in candidates
+          for candidate_data in (candidate.get("candidate_data", _EMPTY),)]
+    
+    def _top_candidates(self, candidates: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+        """Get the highest scoring candidates without sorting the whole list"""
+        return nlargest(count, candidates, key=lambda c: c.get("overall_score") or 0)
     
-    def _generate_hr_recommendations(self, candidates: List[Dict[str, Any]]) -> List[str]:
+    def _count_rankings(self, candidates: List[Dict[str, Any]]) -> HRStats:
+        """Count rankings across candidates, leaving skills uncounted"""
+        return HRStats(
+            total=len(candidates),
+            ranking_counts=Counter(candidate.get("ranking") for candidate in candidates)
+        )
+    
+    def _aggregate(self, candidates: List[Dict[str, Any]]) -> HRStats:
+        """Count rankings and skills across candidates"""
+        stats = self._count_rankings(candidates)
+        stats.skill_counts = Counter(chain.from_iterable(
+            candidate.get("candidate_data", _EMPTY).get("skills") or () for candidate in candidates
+        ))
+        return stats
+    
+    def _generate_hr_recommendations(self, stats: HRStats) -> List[str]:
         """Generate recommendations for HR"""
         recommendations = []
         
-        excellent_count = len([c for c in candidates if c.get("ranking") == "Excellent"])
-        good_count = len([c for c in candidates if c.get("ranking") == "Good"])
+        excellent_count = stats.ranking_counts["Excellent"]
+        good_count = stats.ranking_counts["Good"]
         
         if excellent_count >= 3:
             recommendations.append("Multiple excellent candidates available - proceed with interviews")
@@ -128,34 +182,21 @@ class HRBridge:
         
         return recommendations
     
-    def _analyze_skills(self, candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_skills(self, stats: HRStats) -> Dict[str, Any]:
         """Analyze skills across all candidates"""
-        all_skills = []
-        for candidate in candidates:
-            candidate_data = candidate.get("candidate_data", {})
-            all_skills.extend(candidate_data.get("skills", []))
-        
-        # Count skill frequency
-        skill_counts = {}
-        for skill in all_skills:
-            skill_counts[skill] = skill_counts.get(skill, 0) + 1
-        
-        # Get top skills
-        top_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        
         return {
-            "total_unique_skills": len(skill_counts),
-            "top_skills": top_skills,
-            "skill_distribution": skill_counts
+            "total_unique_skills": len(stats.skill_counts),
+            "top_skills": stats.skill_counts.most_common(10),
+            "skill_distribution": dict(stats.skill_counts)
         }
     
-    def _generate_hiring_recommendations(self, candidates: List[Dict[str, Any]]) -> List[str]:
+    def _generate_hiring_recommendations(self, stats: HRStats) -> List[str]:
         """Generate hiring recommendations"""
         recommendations = []
         
-        if len(candidates) == 0:
+        if stats.total == 0:
             recommendations.append("No candidates found - expand search criteria")
-        elif len(candidates) < 3:
+        elif stats.total < 3:
             recommendations.append("Limited candidate pool - consider broader recruitment")
         else:
             recommendations.append("Sufficient candidates for selection process")
@@ -253,16 +294,7 @@ class HRBridge:
     
     def _generate_review_insights(self, rating: int, notes: str, decision: str) -> List[str]:
         """Generate insights from candidate review"""
-        insights = []
-        
-        if rating >= 8:
-            insights.append("High potential candidate with strong qualifications")
-        elif rating >= 6:
-            insights.append("Good candidate with room for growth")
-        elif rating >= 4:
-            insights.append("Average candidate requiring careful consideration")
-        else:
-            insights.append("Below average candidate - not recommended")
+        insights = [_RATING_INSIGHTS[bisect_right(_RATING_CUTOFFS, rating)]]
         
         if decision == 'approved':
             insights.append("Recommended for interview stage")
@@ -275,51 +307,20 @@ class HRBridge:
     
     def _get_recommendation_from_rating(self, rating: int) -> str:
         """Get recommendation based on rating"""
-        if rating >= 8:
-            return "Strongly recommend"
-        elif rating >= 6:
-            return "Recommend"
-        elif rating >= 4:
-            return "Consider"
-        else:
-            return "Do not recommend"
+        return _RATING_RECOMMENDATIONS[bisect_right(_RATING_CUTOFFS, rating)]
     
-    def _get_next_steps(self, decision: str) -> List[str]:
-        """Get next steps based on decision"""
-        if decision == 'approved':
-            return ["Schedule interview", "Prepare interview questions", "Notify candidate"]
-        elif decision == 'rejected':
-            return ["Send rejection notification", "Update candidate status", "Archive application"]
-        elif decision == 'interview_required':
-            return ["Schedule additional screening", "Prepare technical assessment", "Request references"]
-        else:
-            return ["Review application further", "Request additional information"]
+    def _get_next_steps(self, decision: str) -> Tuple[str, ...]:
+        """Get next steps based on decision, as a shared read-only tuple"""
+        return _NEXT_STEPS.get(decision, _DEFAULT_NEXT_STEPS)
     
     def _generate_feedback_insights(self, technical: int, communication: int, 
                                   culture_fit: int, recommendation: str) -> List[str]:
         """Generate insights from interview feedback"""
-        insights = []
-        
-        if technical >= 8:
-            insights.append("Excellent technical skills")
-        elif technical >= 6:
-            insights.append("Good technical foundation")
-        else:
-            insights.append("Technical skills need improvement")
-        
-        if communication >= 8:
-            insights.append("Strong communication abilities")
-        elif communication >= 6:
-            insights.append("Adequate communication skills")
-        else:
-            insights.append("Communication skills need development")
-        
-        if culture_fit >= 8:
-            insights.append("Excellent cultural fit")
-        elif culture_fit >= 6:
-            insights.append("Good cultural alignment")
-        else:
-            insights.append("Cultural fit concerns")
+        insights = [
+            _TECHNICAL_INSIGHTS[bisect_right(_FEEDBACK_CUTOFFS, technical)],
+            _COMMUNICATION_INSIGHTS[bisect_right(_FEEDBACK_CUTOFFS, communication)],
+            _CULTURE_FIT_INSIGHTS[bisect_right(_FEEDBACK_CUTOFFS, culture_fit)]
+        ]
         
         if recommendation == 'hire':
             insights.append("Recommended for hire")
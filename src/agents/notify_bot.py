@@ -2,19 +2,160 @@
 NotifyBot agent for candidate communications
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from langchain.schema import HumanMessage, AIMessage
-from src.models.llm_config import llm_config
-from src.agentic_prompts.prompts import NOTIFY_BOT_PROMPT
+from functools import cached_property, lru_cache
+from secrets import token_hex
+from src.utils.helpers import parse_iso_datetime
+
+# Message templates, stripped once here instead of on every notification
+_CONFIRMATION_TEMPLATE = """
+Dear {name},
+
+We are pleased to confirm your interview for the position you applied for.
+
+Interview Details:
+- Date: {date}
+- Time: {time}
+- Duration: {duration} minutes
+- Location: {location}
+
+Please ensure you are available at the scheduled time. If you need to reschedule, please contact us at least 24 hours in advance.
+
+Best regards,
+HR Team
+""".strip()
+
+_REMINDER_TEMPLATE = """
+Dear {name},
+
+This is a friendly reminder about your upcoming interview.
+
+Interview Details:
+- Date: {date}
+- Time: {time}
+- Duration: {duration} minutes
+- Location: {location}
+
+Please join the meeting on time. We look forward to speaking with you.
+
+Best regards,
+HR Team
+""".strip()
+
+_STATUS_MESSAGES = {
+    "approved": "Congratulations! Your application has been approved for the next stage.",
+    "rejected": "Thank you for your interest. Unfortunately, we have decided to move forward with other candidates.",
+    "on_hold": "Your application is currently on hold. We will update you as soon as possible.",
+    "interviewed": "Thank you for taking the time to interview with us. We will be in touch soon.",
+    "hired": "Congratulations! We are pleased to offer you the position."
+}
+
+_STATUS_UPDATE_TEMPLATE = """
+Dear {name},
+
+{base_message}
+
+If you have any questions, please don't hesitate to contact us.
+
+Best regards,
+HR Team
+""".strip()
+
+_HIRE_TEMPLATE = """
+Dear {name},
+
+Congratulations! We are pleased to offer you the position.
+
+{salary_line}
+
+{notes}
+
+Please review the offer and respond within 5 business days.
+
+Best regards,
+HR Team
+""".strip()
+
+_REJECT_TEMPLATE = """
+Dear {name},
+
+Thank you for your interest in our company and for taking the time to interview with us.
+
+After careful consideration, we have decided to move forward with other candidates for this position.
+
+{notes}
+
+We wish you the best in your future endeavors.
+
+Best regards,
+HR Team
+""".strip()
+
+_HOLD_TEMPLATE = """
+Dear {name},
+
+Thank you for your interest in our company.
+
+Your application is currently on hold while we complete our review process.
+
+{notes}
+
+We will be in touch with you soon.
+
+Best regards,
+HR Team
+""".strip()
+
+def _build_hire_message(name: str, salary_offer: Optional[int], notes: str) -> str:
+    salary_line = f'Salary Offer: ${salary_offer:,}' if salary_offer else ''
+    return _HIRE_TEMPLATE.format(name=name, salary_line=salary_line, notes=notes)
+
+def _build_reject_message(name: str, salary_offer: Optional[int], notes: str) -> str:
+    return _REJECT_TEMPLATE.format(name=name, notes=notes)
+
+def _build_hold_message(name: str, salary_offer: Optional[int], notes: str) -> str:
+    return _HOLD_TEMPLATE.format(name=name, notes=notes)
+
+# Unknown decisions get the hold message
+_DECISION_BUILDERS = {
+    "hire": _build_hire_message,
+    "reject": _build_reject_message,
+    "hold": _build_hold_message
+}
+
+# Batch kind -> NotifyBot method that sends one (candidate, payload) notification
+_BATCH_SENDERS = {
+    "decision": "send_decision_notification",
+    "interview_confirmation": "send_interview_confirmation",
+    "interview_notification": "send_interview_notification",
+    "interview_reminder": "send_interview_reminder"
+}
+
+@lru_cache(maxsize=1024)
+def _render_status_update(name: str, status: str) -> str:
+    """Render the default status update for a candidate name and status"""
+    base_message = _STATUS_MESSAGES.get(status, "Your application status has been updated.")
+    return _STATUS_UPDATE_TEMPLATE.format(name=name, base_message=base_message)
+
+@lru_cache(maxsize=256)
+def _format_interview_time(scheduled_time: str) -> Tuple[str, str]:
+    """Parse an ISO interview time once and format its date and time parts"""
+    date, time = parse_iso_datetime(scheduled_time).strftime('%B %d, %Y|%I:%M %p').split('|', 1)
+    return date, time
 
 class NotifyBot:
     """NotifyBot agent for candidate notifications"""
     
     def __init__(self):
-        self.llm = llm_config.get_llm()
         self.name = "NotifyBot"
     
+    @cached_property
+    def llm(self):
+        """Get the shared LLM the first time a message needs it"""
+        from src.models.llm_config import llm_config
+        return llm_config.get_llm()
+    
     def send_interview_confirmation(self, candidate: Dict[str, Any], 
                                   interview: Dict[str, Any]) -> Dict[str, Any]:
         """Send interview confirmation to candidate"""
@@ -60,7 +201,8 @@ class NotifyBot:
             }
     
     def send_decision_notification(self, candidate: Dict[str, Any], 
-                                 decision_data: Dict[str, Any]) -> Dict[str, Any]:
+                                 decision_data: Dict[str, Any],
+                                 sent_at: Optional[str] = None) -> Dict[str, Any]:
         """Send final decision notification to candidate"""
         try:
             message = self._generate_decision_notification_message(candidate, decision_data)
@@ -72,7 +214,7 @@ class NotifyBot:
                 "subject": "Application Decision",
                 "message": message,
                 "status": "sent",
-                "sent_at": datetime.now().isoformat(),
+                "sent_at": sent_at or datetime.now().isoformat(),
                 "success": True
             }
             
@@ -84,6 +226,26 @@ class NotifyBot:
                 "message": f"Error sending decision notification: {str(e)}"
             }
     
+    def send_batch(self, items: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+                   kind: str = "decision") -> List[Dict[str, Any]]:
+        """Send one kind of notification for many (candidate, payload) pairs"""
+        if kind not in _BATCH_SENDERS:
+            return [{"success": False, "message": f"Unknown notification kind: {kind}"} for _ in items]
+        
+        send = getattr(self, _BATCH_SENDERS[kind])
+        extra = (self._batch_timestamp(),) if kind == "decision" else ()
+        return [send(candidate, payload, *extra) for candidate, payload in items]
+    
+    def send_status_updates(self, candidates: List[Dict[str, Any]], 
+                            status: str, message: str = None) -> List[Dict[str, Any]]:
+        """Send the same status update to many candidates"""
+        sent_at = self._batch_timestamp()
+        return [self.send_status_update(candidate, status, message, sent_at) for candidate in candidates]
+    
+    def _batch_timestamp(self) -> str:
+        """Get one send timestamp shared by every notification in a batch"""
+        return datetime.now().isoformat()
+    
     def send_interview_reminder(self, candidate: Dict[str, Any], 
                               interview: Dict[str, Any]) -> Dict[str, Any]:
         """Send interview reminder to candidate"""
@@ -106,7 +268,8 @@ class NotifyBot:
             return {"error": f"Error sending interview reminder: {str(e)}"}
     
     def send_status_update(self, candidate: Dict[str, Any], 
-                          status: str, message: str = None) -> Dict[str, Any]:
+                          status: str, message: str = None,
+                          sent_at: Optional[str] = None) -> Dict[str, Any]:
         """Send status update to candidate"""
         try:
             notification_message = self._generate_status_update_message(candidate, status, message)
@@ -118,7 +281,7 @@ class NotifyBot:
                 "subject": f"Application Status Update",
                 "message": notification_message,
                 "status": "sent",
-                "sent_at": datetime.now().isoformat()
+                "sent_at": sent_at or datetime.now().isoformat()
             }
             
             return notification
@@ -148,48 +311,24 @@ class NotifyBot:
     def _generate_interview_confirmation_message(self, candidate: Dict[str, Any], 
                                                 interview: Dict[str, Any]) -> str:
         """Generate interview confirmation message"""
-        interview_time = datetime.fromisoformat(interview.get("scheduled_time"))
-        
-        message = f"""
-Dear {candidate.get('name', 'Candidate')},
-
-We are pleased to confirm your interview for the position you applied for.
-
-Interview Details:
-- Date: {interview_time.strftime('%B %d, %Y')}
-- Time: {interview_time.strftime('%I:%M %p')}
-- Duration: {interview.get('duration', 60)} minutes
-- Location: {interview.get('location', 'Virtual Meeting')}
-
-Please ensure you are available at the scheduled time. If you need to reschedule, please contact us at least 24 hours in advance.
-
-Best regards,
-HR Team
-"""
-        return message.strip()
+        return _CONFIRMATION_TEMPLATE.format(**self._interview_fields(candidate, interview))
     
     def _generate_interview_reminder_message(self, candidate: Dict[str, Any], 
                                            interview: Dict[str, Any]) -> str:
         """Generate interview reminder message"""
-        interview_time = datetime.fromisoformat(interview.get("scheduled_time"))
-        
-        message = f"""
-Dear {candidate.get('name', 'Candidate')},
-
-This is a friendly reminder about your upcoming interview.
-
-Interview Details:
-- Date: {interview_time.strftime('%B %d, %Y')}
-- Time: {interview_time.strftime('%I:%M %p')}
-- Duration: {interview.get('duration', 60)} minutes
-- Location: {interview.get('location', 'Virtual Meeting')}
-
-Please join the meeting on time. We look forward to speaking with you.
-
-Best regards,
-HR Team
-"""
-        return message.strip()
+        return _REMINDER_TEMPLATE.format(**self._interview_fields(candidate, interview))
+    
+    def _interview_fields(self, candidate: Dict[str, Any], 
+                          interview: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the values shared by the interview message templates"""
+        date, time = _format_interview_time(interview.get("scheduled_time"))
+        return {
+            "name": candidate.get('name', 'Candidate'),
+            "date": date,
+            "time": time,
+            "duration": interview.get('duration', 60),
+            "location": interview.get('location', 'Virtual Meeting')
+        }
     
     def _generate_status_update_message(self, candidate: Dict[str, Any], 
                                       status: str, custom_message: str = None) -> str:
@@ -197,27 +336,7 @@ HR Team
         if custom_message:
             return custom_message
         
-        status_messages = {
-            "approved": "Congratulations! Your application has been approved for the next stage.",
-            "rejected": "Thank you for your interest. Unfortunately, we have decided to move forward with other candidates.",
-            "on_hold": "Your application is currently on hold. We will update you as soon as possible.",
-            "interviewed": "Thank you for taking the time to interview with us. We will be in touch soon.",
-            "hired": "Congratulations! We are pleased to offer you the position."
-        }
-        
-        base_message = status_messages.get(status, "Your application status has been updated.")
-        
-        message = f"""
-Dear {candidate.get('name', 'Candidate')},
-
-{base_message}
-
-If you have any questions, please don't hesitate to contact us.
-
-Best regards,
-HR Team
-"""
-        return message.strip()
+        return _render_status_update(candidate.get('name', 'Candidate'), status)
     
     def _generate_decision_notification_message(self, candidate: Dict[str, Any], 
                                               decision_data: Dict[str, Any]) -> str:
@@ -226,55 +345,10 @@ HR Team
         salary_offer = decision_data.get('salary_offer')
         notes = decision_data.get('notes', '')
         
-        if decision == 'hire':
-            message = f"""
-Dear {candidate.get('name', 'Candidate')},
-
-Congratulations! We are pleased to offer you the position.
-
-{f'Salary Offer: ${salary_offer:,}' if salary_offer else ''}
-
-{notes if notes else ''}
-
-Please review the offer and respond within 5 business days.
-
-Best regards,
-HR Team
-"""
-        elif decision == 'reject':
-            message = f"""
-Dear {candidate.get('name', 'Candidate')},
-
-Thank you for your interest in our company and for taking the time to interview with us.
-
-After careful consideration, we have decided to move forward with other candidates for this position.
-
-{notes if notes else ''}
-
-We wish you the best in your future endeavors.
-
-Best regards,
-HR Team
-"""
-        else:  # hold
-            message = f"""
-Dear {candidate.get('name', 'Candidate')},
-
-Thank you for your interest in our company.
-
-Your application is currently on hold while we complete our review process.
-
-{notes if notes else ''}
-
-We will be in touch with you soon.
-
-Best regards,
-HR Team
-"""
-        
-        return message.strip()
+        builder = _DECISION_BUILDERS.get(decision, _build_hold_message)
+        return builder(candidate.get('name', 'Candidate'), salary_offer, notes if notes else '')
     
-    def _generate_notification_id(self) -> str:
+    @staticmethod
+    def _generate_notification_id() -> str:
         """Generate unique notification ID"""
-        from src.utils.helpers import generate_id
-        return f"NOT_{generate_id()[:8]}"
\ No newline at end of file
+        return f"NOT_{token_hex(4)}"
\ No newline at end of file
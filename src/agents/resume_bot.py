@@ -2,32 +2,43 @@
 ResumeBot agent for collecting and parsing resumes
 """
 
+import hashlib
+import os
+from functools import cached_property
 from typing import Dict, List, Any, Optional
-from langchain.schema import HumanMessage, AIMessage
-from src.models.llm_config import llm_config
 from src.agentic_prompts.prompts import RESUME_BOT_PROMPT
 from src.tools.resume_parser import ResumeParser
 from src.tools.file_handler import FileHandler
 from src.utils.helpers import generate_id, get_timestamp
 from src.schema.data_models import Candidate
 
+# Parsed resumes kept per content hash; the cache is cleared when full
+PARSE_CACHE_SIZE = 256
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 class ResumeBot:
     """ResumeBot agent for resume collection and parsing"""
     
     def __init__(self):
-        self.llm = llm_config.get_llm()
         self.parser = ResumeParser()
         self.file_handler = FileHandler()
         self.name = "ResumeBot"
+        self._parse_cache: Dict[str, Dict[str, Any]] = {}
+    
+    @cached_property
+    def llm(self):
+        """Get the shared LLM, created only when first used"""
+        from src.models.llm_config import llm_config
+        return llm_config.get_llm()
     
     def process_resume(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process resume data and extract information"""
         try:
             # Parse resume content
             if 'file_path' in resume_data:
-                parsed_data = self.parser.parse_resume(file_path=resume_data['file_path'])
+                parsed_data = self._parse_cached(file_path=resume_data['file_path'])
             elif 'text' in resume_data:
-                parsed_data = self.parser.parse_resume(text=resume_data['text'])
+                parsed_data = self._parse_cached(text=resume_data['text'])
             else:
                 return {"error": "No resume content provided"}
             
@@ -61,9 +72,37 @@ class ResumeBot:
         except Exception as e:
             return {"error": f"Error processing resume: {str(e)}"}
     
+    def _parse_cached(self, file_path: str = None, text: str = None) -> Dict[str, Any]:
+        """Parse a resume, reusing the result for content already parsed"""
+        if file_path:
+            if not os.path.exists(file_path):
+                return self.parser.parse_resume(file_path=file_path)
+            # Hash the file in chunks so large uploads are never held in memory whole
+            digest = hashlib.sha256(b'pdf:')
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        elif text:
+            digest = hashlib.sha256(b'text:' + text.encode('utf-8', 'surrogatepass'))
+        else:
+            return self.parser.parse_resume(file_path=file_path, text=text)
+        
+        key = digest.hexdigest()
+        parsed_data = self._parse_cache.get(key)
+        if parsed_data is None:
+            parsed_data = self.parser.parse_resume(file_path=file_path, text=text)
+            if 'error' in parsed_data:
+                return parsed_data
+            if len(self._parse_cache) >= PARSE_CACHE_SIZE:
+                self._parse_cache.clear()
+            self._parse_cache[key] = parsed_data
+        
+        return dict(parsed_data, skills=list(parsed_data['skills']))
+    
     def chat_with_candidate(self, message: str, context: Dict[str, Any]) -> str:
         """Chat with candidate for resume collection"""
         try:
+            from langchain.schema import HumanMessage
             prompt = RESUME_BOT_PROMPT.format(context=context)
             
             messages = [
@@ -2,26 +2,282 @@
 StoreKeeper agent for data management
 """
 
-from typing import Dict, List, Any, Optional
-from src.utils.helpers import save_json, load_json, append_to_json_list, generate_id
+import atexit
+import os
+import threading
+import time
+from copy import deepcopy
+from typing import Dict, List, Any, Optional, Tuple
+from src.utils.helpers import save_json, load_json, append_jsonl, load_jsonl, generate_id
 from src.utils.config import config
 from src.schema.data_models import Candidate, Job, Interview
 
+# Collection key -> config entry holding its file path
+_COLLECTIONS = {
+    "candidates": "candidates_file",
+    "jobs": "jobs_file",
+    "interviews": "interviews_file"
+}
+
+# Write debouncing: pending changes are flushed after a quiet window that doubles
+# (up to the cap) while flushes keep arriving back to back, or once enough pile up
+_FLUSH_DELAY = 0.1
+_MAX_FLUSH_DELAY = 2.0
+_FLUSH_THRESHOLD = 64
+
+# Changes are appended to a JSONL log next to each JSON file; the JSON file is
+# rewritten only when the log grows past this many lines per record
+_COMPACT_RATIO = 2
+
+# Each compaction bumps a generation stored in the JSON file and stamped on every
+# log line, so lines already folded into the JSON file are never replayed twice
+_GENERATION_KEY = "log_generation"
+
 class StoreKeeper:
     """StoreKeeper agent for data storage and retrieval"""
     
     def __init__(self):
+        config.ensure_dirs()
         self.config = config.get_config()
         self.name = "StoreKeeper"
+        self._lock = threading.RLock()
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._index: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+        self._signatures: Dict[str, Tuple[Optional[Tuple[int, int]], ...]] = {}
+        self._pending_ops: Dict[str, List[Dict[str, Any]]] = {key: [] for key in _COLLECTIONS}
+        self._log_lines: Dict[str, int] = {}
+        self._generations: Dict[str, int] = {}
+        self._pending = 0
+        self._flush_delay = _FLUSH_DELAY
+        self._last_flush = 0.0
+        # Set on every queued change; one long-lived thread flushes once they stop arriving
+        self._changed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        # Message of the last failed flush, reported by the next store or update call
+        self.last_flush_error: Optional[str] = None
+        for key in _COLLECTIONS:
+            self._load(key)
+        atexit.register(self.flush)
+    
+    def _path(self, key: str) -> str:
+        """Get the consolidated JSON file of a collection"""
+        return self.config[_COLLECTIONS[key]]
+    
+    def _log_path(self, key: str) -> str:
+        """Get the append-only JSONL change log of a collection"""
+        return os.path.splitext(self._path(key))[0] + ".jsonl"
+    
+    def _signature(self, key: str) -> Tuple[Optional[Tuple[int, int]], ...]:
+        """Get the modification time and size of a collection's files"""
+        signature = []
+        for path in (self._path(key), self._log_path(key)):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def _load(self, key: str) -> Dict[str, Any]:
+        """Load a collection and its id index, re-reading only if the files changed on disk"""
+        with self._lock:
+            # Unflushed changes make memory the newer copy
+            if self._pending_ops[key]:
+                return self._data[key]
+            signature = self._signature(key)
+            if key in self._data and self._signatures.get(key) == signature:
+                return self._data[key]
+            
+            data = load_json(self._path(key))
+            records = data.setdefault(key, [])
+            index = {}
+            for record in records:
+                # Keep the first record for an id, as the old linear scans did
+                index.setdefault(record.get("id"), record)
+            
+            self._data[key] = data
+            self._index[key] = index
+            generation = data.get(_GENERATION_KEY, 0)
+            self._generations[key] = generation
+            
+            # Replay changes logged since the last compaction
+            log = load_jsonl(self._log_path(key))
+            for entry in log:
+                if entry.get("gen", 0) < generation:
+                    # Left over from a compaction that stopped before truncating the log
+                    continue
+                if entry.get("op") == "append":
+                    self._apply_append(key, entry["record"])
+                else:
+                    self._apply_update(key, entry["record"])
+            
+            self._log_lines[key] = len(log)
+            self._signatures[key] = signature
+            return data
+    
+    def _records(self, key: str) -> List[Dict[str, Any]]:
+        """Get copies of a collection's records, so callers cannot change the store by accident"""
+        with self._lock:
+            return deepcopy(self._load(key)[key])
+    
+    def _lookup(self, key: str, record_id: Any) -> Optional[Dict[str, Any]]:
+        """Find a record by ID through the collection index"""
+        with self._lock:
+            self._load(key)
+            return self._index[key].get(record_id)
+    
+    def _find(self, key: str, record_id: Any) -> Optional[Dict[str, Any]]:
+        """Get a copy of the record with the given ID"""
+        with self._lock:
+            record = self._lookup(key, record_id)
+            return deepcopy(record) if record is not None else None
+    
+    def _apply_append(self, key: str, record: Dict[str, Any]) -> None:
+        """Add a record to the in-memory collection and its index"""
+        self._data[key][key].append(record)
+        self._index[key].setdefault(record.get("id"), record)
+    
+    def _apply_update(self, key: str, record_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Replace the record sharing record_data's ID in place"""
+        record = self._index[key].get(record_data.get("id"))
+        if record is not None and record is not record_data:
+            # The list holds the same object, so updating it keeps the on-disk order
+            record.clear()
+            record.update(record_data)
+        return record
+    
+    def _save(self, key: str, ops: List[Dict[str, Any]]) -> bool:
+        """Queue logged changes for a collection and schedule a debounced flush"""
+        with self._lock:
+            if not ops:
+                return True
+            self._pending_ops[key].extend(ops)
+            self._pending += len(ops)
+            # Flush now if enough piled up, or to retry and report a failed background flush
+            if self._pending >= _FLUSH_THRESHOLD or self.last_flush_error:
+                return self.flush()
+            self._ensure_flusher()
+            self._changed.set()
+            return True
+    
+    def _ensure_flusher(self):
+        """Start the background flush thread on first use"""
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._run_flusher, name="store-flusher", daemon=True)
+            self._flusher.start()
+    
+    def _run_flusher(self):
+        """Flush pending changes once no new change has arrived for one window"""
+        while True:
+            self._changed.wait()
+            self._changed.clear()
+            while self._changed.wait(self._flush_delay):
+                self._changed.clear()
+            self.flush()
+    
+    def flush(self) -> bool:
+        """Append every collection's pending changes to its log, compacting oversized logs"""
+        with self._lock:
+            if not self._pending:
+                return True
+            
+            # Back off while writes keep landing inside the current window
+            now = time.monotonic()
+            if now - self._last_flush < self._flush_delay * 2:
+                self._flush_delay = min(self._flush_delay * 2, _MAX_FLUSH_DELAY)
+            else:
+                self._flush_delay = _FLUSH_DELAY
+            self._last_flush = now
+            
+            success = True
+            failed = []
+            for key, ops in self._pending_ops.items():
+                if not ops:
+                    continue
+                for op in ops:
+                    op["gen"] = self._generations[key]
+                if not append_jsonl(ops, self._log_path(key)):
+                    # Stay pending so the next flush retries the write
+                    success = False
+                    failed.append(key)
+                    continue
+                self._log_lines[key] += len(ops)
+                ops.clear()
+                if self._log_lines[key] > _COMPACT_RATIO * max(len(self._index[key]), 1):
+                    success = self._compact(key) and success
+                self._signatures[key] = self._signature(key)
+            self._pending = sum(len(ops) for ops in self._pending_ops.values())
+            # A failed compaction leaves the changes safe in the log, so only failed appends count
+            if failed:
+                self.last_flush_error = f"Failed to write pending {', '.join(failed)} to disk"
+            else:
+                self.last_flush_error = None
+            return success
+    
+    def compact(self) -> bool:
+        """Flush pending changes and fold every change log into its JSON file"""
+        with self._lock:
+            success = self.flush()
+            for key in _COLLECTIONS:
+                if self._log_lines.get(key) and not self._pending_ops[key]:
+                    success = self._compact(key) and success
+                    self._signatures[key] = self._signature(key)
+            return success
+    
+    def _compact(self, key: str) -> bool:
+        """Rewrite a collection's JSON file under a new generation and truncate its change log"""
+        data = self._data[key]
+        generation = self._generations[key] + 1
+        data[_GENERATION_KEY] = generation
+        if not save_json(data, self._path(key)):
+            data[_GENERATION_KEY] = self._generations[key]
+            return False
+        # From here the old log lines are stale even if truncating fails
+        self._generations[key] = generation
+        try:
+            open(self._log_path(key), 'w').close()
+        except OSError as e:
+            print(f"Error truncating {self._log_path(key)}: {e}")
+            return False
+        self._log_lines[key] = 0
+        return True
+    
+    def _append(self, key: str, items: List[Dict[str, Any]]) -> bool:
+        """Add records to a collection and log them"""
+        with self._lock:
+            self._load(key)
+            # Store copies so the caller's objects stay separate from the store
+            records = deepcopy(items)
+            for record in records:
+                self._apply_append(key, record)
+            return self._save(key, [{"op": "append", "record": record} for record in records])
+    
+    def _replace(self, key: str, records_data: List[Dict[str, Any]]) -> bool:
+        """Replace the records sharing each update's ID and log the changes together"""
+        with self._lock:
+            self._load(key)
+            ops = []
+            for record_data in deepcopy(records_data):
+                record = self._apply_update(key, record_data)
+                if record is not None:
+                    ops.append({"op": "update", "record": record})
+            return self._save(key, ops)
+    
+    def _set_statuses(self, statuses: Dict[str, str]) -> bool:
+        """Set candidate statuses through the index and log the changes together"""
+        with self._lock:
+            ops = []
+            for candidate_id, status in statuses.items():
+                candidate = self._lookup("candidates", candidate_id)
+                if candidate is not None:
+                    candidate["status"] = status
+                    ops.append({"op": "update", "record": candidate})
+            return self._save("candidates", ops)
     
     def store_candidate(self, candidate_data: Dict[str, Any]) -> Dict[str, Any]:
         """Store candidate data"""
         try:
-            result = append_to_json_list(
-                candidate_data, 
-                self.config["candidates_file"], 
-                "candidates"
-            )
+            result = self._append("candidates", [candidate_data])
             
             if result:
                 return {"success": True, "message": "Candidate stored successfully"}
@@ -31,11 +287,23 @@ class StoreKeeper:
         except Exception as e:
             return {"success": False, "message": f"Error storing candidate: {str(e)}"}
     
+    def store_candidates_bulk(self, candidates_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Store several candidates with a single write"""
+        try:
+            result = self._append("candidates", candidates_data)
+            
+            if result:
+                return {"success": True, "message": f"{len(candidates_data)} candidates stored successfully"}
+            else:
+                return {"success": False, "message": "Failed to store candidates"}
+                
+        except Exception as e:
+            return {"success": False, "message": f"Error storing candidates: {str(e)}"}
+    
     def get_candidates(self) -> List[Dict[str, Any]]:
         """Retrieve all candidates"""
         try:
-            data = load_json(self.config["candidates_file"])
-            return data.get("candidates", [])
+            return self._records("candidates")
         except Exception as e:
             print(f"Error retrieving candidates: {e}")
             return []
@@ -43,11 +311,7 @@ class StoreKeeper:
     def get_candidate_by_id(self, candidate_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve candidate by ID"""
         try:
-            candidates = self.get_candidates()
-            for candidate in candidates:
-                if candidate.get("id") == candidate_id:
-                    return candidate
-            return None
+            return self._find("candidates", candidate_id)
         except Exception as e:
             print(f"Error retrieving candidate by ID: {e}")
             return None
@@ -55,11 +319,7 @@ class StoreKeeper:
     def store_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """Store job data"""
         try:
-            result = append_to_json_list(
-                job_data, 
-                self.config["jobs_file"], 
-                "jobs"
-            )
+            result = self._append("jobs", [job_data])
             
             if result:
                 return {"success": True, "message": "Job stored successfully"}
@@ -72,8 +332,7 @@ class StoreKeeper:
     def get_jobs(self) -> List[Dict[str, Any]]:
         """Retrieve all jobs"""
         try:
-            data = load_json(self.config["jobs_file"])
-            return data.get("jobs", [])
+            return self._records("jobs")
         except Exception as e:
             print(f"Error retrieving jobs: {e}")
             return []
@@ -81,11 +340,7 @@ class StoreKeeper:
     def get_job_by_id(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve job by ID"""
         try:
-            jobs = self.get_jobs()
-            for job in jobs:
-                if job.get("id") == job_id:
-                    return job
-            return None
+            return self._find("jobs", job_id)
         except Exception as e:
             print(f"Error retrieving job by ID: {e}")
             return None
@@ -93,11 +348,7 @@ class StoreKeeper:
     def store_interview(self, interview_data: Dict[str, Any]) -> Dict[str, Any]:
         """Store interview data"""
         try:
-            result = append_to_json_list(
-                interview_data, 
-                self.config["interviews_file"], 
-                "interviews"
-            )
+            result = self._append("interviews", [interview_data])
             
             if result:
                 return {"success": True, "message": "Interview stored successfully"}
@@ -107,11 +358,23 @@ class StoreKeeper:
         except Exception as e:
             return {"success": False, "message": f"Error storing interview: {str(e)}"}
     
+    def store_interviews_bulk(self, interviews_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Store several interviews with a single write"""
+        try:
+            result = self._append("interviews", interviews_data)
+            
+            if result:
+                return {"success": True, "message": f"{len(interviews_data)} interviews stored successfully"}
+            else:
+                return {"success": False, "message": "Failed to store interviews"}
+                
+        except Exception as e:
+            return {"success": False, "message": f"Error storing interviews: {str(e)}"}
+    
     def get_interviews(self) -> List[Dict[str, Any]]:
         """Retrieve all interviews"""
         try:
-            data = load_json(self.config["interviews_file"])
-            return data.get("interviews", [])
+            return self._records("interviews")
         except Exception as e:
             print(f"Error retrieving interviews: {e}")
             return []
@@ -119,16 +382,7 @@ class StoreKeeper:
     def update_candidate_status(self, candidate_id: str, status: str) -> Dict[str, Any]:
         """Update candidate status"""
         try:
-            data = load_json(self.config["candidates_file"])
-            candidates = data.get("candidates", [])
-            
-            for candidate in candidates:
-                if candidate.get("id") == candidate_id:
-                    candidate["status"] = status
-                    break
-            
-            data["candidates"] = candidates
-            result = save_json(data, self.config["candidates_file"])
+            result = self._set_statuses({candidate_id: status})
             
             if result:
                 return {"success": True, "message": "Status updated successfully"}
@@ -138,20 +392,23 @@ class StoreKeeper:
         except Exception as e:
             return {"success": False, "message": f"Error updating status: {str(e)}"}
     
+    def update_candidate_statuses(self, statuses: Dict[str, str]) -> Dict[str, Any]:
+        """Update several candidate statuses (candidate ID -> status) with a single write"""
+        try:
+            result = self._set_statuses(statuses)
+            
+            if result:
+                return {"success": True, "message": f"{len(statuses)} statuses updated successfully"}
+            else:
+                return {"success": False, "message": "Failed to update statuses"}
+                
+        except Exception as e:
+            return {"success": False, "message": f"Error updating statuses: {str(e)}"}
+    
     def update_candidate(self, candidate_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update candidate data"""
         try:
-            data = load_json(self.config["candidates_file"])
-            candidates = data.get("candidates", [])
-            
-            # Find and update the candidate
-            for i, candidate in enumerate(candidates):
-                if candidate.get("id") == candidate_data.get("id"):
-                    candidates[i] = candidate_data
-                    break
-            
-            data["candidates"] = candidates
-            result = save_json(data, self.config["candidates_file"])
+            result = self._replace("candidates", [candidate_data])
             
             if result:
                 return {"success": True, "message": "Candidate updated successfully"}
@@ -161,20 +418,23 @@ class StoreKeeper:
         except Exception as e:
             return {"success": False, "message": f"Error updating candidate: {str(e)}"}
     
+    def update_candidates_bulk(self, candidates_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Update several candidates with a single write"""
+        try:
+            result = self._replace("candidates", candidates_data)
+            
+            if result:
+                return {"success": True, "message": f"{len(candidates_data)} candidates updated successfully"}
+            else:
+                return {"success": False, "message": "Failed to update candidates"}
+                
+        except Exception as e:
+            return {"success": False, "message": f"Error updating candidates: {str(e)}"}
+    
     def update_interview(self, interview_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update interview data"""
         try:
-            data = load_json(self.config["interviews_file"])
-            interviews = data.get("interviews", [])
-            
-            # Find and update the interview
-            for i, interview in enumerate(interviews):
-                if interview.get("id") == interview_data.get("id"):
-                    interviews[i] = interview_data
-                    break
-            
-            data["interviews"] = interviews
-            result = save_json(data, self.config["interviews_file"])
+            result = self._replace("interviews", [interview_data])
             
             if result:
                 return {"success": True, "message": "Interview updated successfully"}
@@ -182,4 +442,17 @@ class StoreKeeper:
                 return {"success": False, "message": "Failed to update interview"}
                 
         except Exception as e:
-            return {"success": False, "message": f"Error updating interview: {str(e)}"}
\ No newline at end of file
+            return {"success": False, "message": f"Error updating interview: {str(e)}"}
+    
+    def update_interviews_bulk(self, interviews_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Update several interviews with a single write"""
+        try:
+            result = self._replace("interviews", interviews_data)
+            
+            if result:
+                return {"success": True, "message": f"{len(interviews_data)} interviews updated successfully"}
+            else:
+                return {"success": False, "message": "Failed to update interviews"}
+                
+        except Exception as e:
+            return {"success": False, "message": f"Error updating interviews: {str(e)}"}
\ No newline at end of file
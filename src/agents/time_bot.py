@@ -2,20 +2,29 @@
 TimeBot agent for interview scheduling
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-from langchain.schema import HumanMessage, AIMessage
-from src.models.llm_config import llm_config
-from src.agentic_prompts.prompts import TIME_BOT_PROMPT
+from functools import cached_property
+from typing import Dict, List, Any, FrozenSet, Optional, Tuple
+from datetime import date, datetime
 from src.tools.scheduler import Scheduler
+from src.utils.helpers import parse_iso_datetime
+
+# Day names indexed by datetime.weekday(), matching strftime("%A") in the C locale
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
 class TimeBot:
     """TimeBot agent for interview scheduling"""
     
     def __init__(self):
-        self.llm = llm_config.get_llm()
         self.scheduler = Scheduler()
         self.name = "TimeBot"
+        # date_range -> (day the slots were generated for, their ISO times)
+        self._slot_cache: Dict[int, Tuple[date, FrozenSet[str]]] = {}
+    
+    @cached_property
+    def llm(self):
+        """Get the shared LLM, created only when first used"""
+        from src.models.llm_config import llm_config
+        return llm_config.get_llm()
     
     def schedule_interview(self, candidate_id: str, job_id: str, 
                           preferred_time: Optional[str] = None) -> Dict[str, Any]:
@@ -25,7 +34,7 @@ class TimeBot:
             pref_datetime = None
             if preferred_time:
                 try:
-                    pref_datetime = datetime.fromisoformat(preferred_time)
+                    pref_datetime = parse_iso_datetime(preferred_time)
                 except:
                     pref_datetime = None
             
@@ -58,39 +67,40 @@ class TimeBot:
             start_date = datetime.now()
             available_slots = self.scheduler.generate_time_slots(start_date, date_range)
             
-            formatted_slots = []
-            for slot in available_slots:
-                formatted_slots.append({
-                    "datetime": slot.isoformat(),
-                    "date": slot.strftime("%Y-%m-%d"),
-                    "time": slot.strftime("%H:%M"),
-                    "day_of_week": slot.strftime("%A"),
-                    "available": True
-                })
-            
-            return formatted_slots
+            return [{
+                "datetime": slot.isoformat(),
+                "date": slot.date().isoformat(),
+                "time": f"{slot.hour:02d}:{slot.minute:02d}",
+                "day_of_week": _WEEKDAYS[slot.weekday()],
+                "available": True
+            } for slot in available_slots]
             
         except Exception as e:
             return [{"error": f"Error getting available slots: {str(e)}"}]
     
+    def _available_iso_set(self, date_range: int = 7) -> FrozenSet[str]:
+        """Get the ISO times of the available slots, regenerated once per day"""
+        today = date.today()
+        cached = self._slot_cache.get(date_range)
+        if cached is None or cached[0] != today:
+            # Slots depend only on the start day, so they stay valid until midnight
+            slots = self.scheduler.generate_time_slots(datetime.now(), date_range)
+            cached = (today, frozenset(slot.isoformat() for slot in slots))
+            self._slot_cache[date_range] = cached
+        return cached[1]
+    
     def reschedule_interview(self, interview_id: str, new_time: str) -> Dict[str, Any]:
         """Reschedule an existing interview"""
         try:
             # Parse new time
-            new_datetime = datetime.fromisoformat(new_time)
+            new_datetime = parse_iso_datetime(new_time)
             
             # Validate new time slot
             if new_datetime < datetime.now():
                 return {"error": "Cannot schedule interview in the past"}
             
             # Check if slot is available
-            available_slots = self.get_available_slots()
-            slot_available = any(
-                slot["datetime"] == new_datetime.isoformat() 
-                for slot in available_slots
-            )
-            
-            if not slot_available:
+            if new_datetime.isoformat() not in self._available_iso_set():
                 return {"error": "Selected time slot is not available"}
             
             return {
@@ -2,6 +2,7 @@
 LLM configuration and setup
 """
 
+import threading
 import google.generativeai as genai
 from langchain_google_genai import ChatGoogleGenerativeAI
 from src.utils.config import config
@@ -17,13 +18,25 @@ class LLMConfig:
         # Configure Gemini
         genai.configure(api_key=self.api_key)
         
-        # Initialize LangChain LLM
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash",
-            google_api_key=self.api_key,
-            temperature=0.7,
-            convert_system_message_to_human=True
-        )
+        # The LangChain LLM is created on first use and shared by all agents
+        self._llm = None
+        self._llm_lock = threading.Lock()
+    
+    @property
+    def llm(self):
+        """Get the shared LLM instance, creating it on first access"""
+        if self._llm is None:
+            with self._llm_lock:
+                if self._llm is None:
+                    self._llm = ChatGoogleGenerativeAI(
+                        model="gemini-2.0-flash",
+                        google_api_key=self.api_key,
+                        temperature=0.7,
+                        convert_system_message_to_human=True,
+                        # One long-lived gRPC channel multiplexes every agent's calls over HTTP/2
+                        transport="grpc"
+                    )
+        return self._llm
     
     def get_llm(self):
         """Get the configured LLM instance"""
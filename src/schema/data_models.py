@@ -3,10 +3,10 @@ Data models for the recruitment assistant
 """
 
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     """Candidate data model"""
     id: str
@@ -28,9 +28,22 @@ class Candidate:
             self.created_at = datetime.now().isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Field-by-field copy; asdict would deep-copy every nested value
+        return {
+            "id": self.id,
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "skills": list(self.skills) if self.skills is not None else None,
+            "experience": self.experience,
+            "education": self.education,
+            "resume_path": self.resume_path,
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": self.created_at
+        }
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Job data model"""
     id: str
@@ -48,9 +61,19 @@ class Job:
             self.created_at = datetime.now().isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "requirements": list(self.requirements),
+            "skills_required": list(self.skills_required),
+            "experience_level": self.experience_level,
+            "department": self.department,
+            "status": self.status,
+            "created_at": self.created_at
+        }
 
-@dataclass
+@dataclass(slots=True)
 class Interview:
     """Interview data model"""
     id: str
@@ -68,9 +91,19 @@ class Interview:
             self.created_at = datetime.now().isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "candidate_id": self.candidate_id,
+            "job_id": self.job_id,
+            "interviewer": self.interviewer,
+            "scheduled_time": self.scheduled_time,
+            "type": self.type,
+            "status": self.status,
+            "notes": self.notes,
+            "created_at": self.created_at
+        }
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """State management for agents"""
     messages: List[Dict[str, Any]]
@@ -79,6 +112,10 @@ class AgentState:
     candidates: List[Candidate]
     jobs: List[Job]
     interviews: List[Interview]
+    # Lookup indexes derived from the lists; kept out of comparison and to_dict
+    candidates_by_id: Dict[str, Candidate] = field(default_factory=dict, init=False, repr=False, compare=False)
+    interviews_by_candidate: Dict[str, List[Interview]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indexed_counts: tuple = field(default=(0, 0), init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.messages:
@@ -90,4 +127,56 @@ class AgentState:
         if not self.jobs:
             self.jobs = []
         if not self.interviews:
-            self.interviews = []
\ No newline at end of file
+            self.interviews = []
+        
+        self._reindex()
+    
+    def _reindex(self) -> None:
+        """Rebuild the lookup indexes from the candidate and interview lists"""
+        self.candidates_by_id = {}
+        self.interviews_by_candidate = {}
+        for candidate in self.candidates:
+            self.candidates_by_id.setdefault(candidate.id, candidate)
+        for interview in self.interviews:
+            self.interviews_by_candidate.setdefault(interview.candidate_id, []).append(interview)
+        self._indexed_counts = (len(self.candidates), len(self.interviews))
+    
+    def _sync_index(self) -> None:
+        """Reindex if the lists grew or shrank outside add_candidate/add_interview"""
+        if self._indexed_counts != (len(self.candidates), len(self.interviews)):
+            self._reindex()
+    
+    def add_candidate(self, candidate: Candidate) -> None:
+        """Add a candidate and index it by ID"""
+        self._sync_index()
+        self.candidates.append(candidate)
+        self.candidates_by_id.setdefault(candidate.id, candidate)
+        self._indexed_counts = (len(self.candidates), len(self.interviews))
+    
+    def add_interview(self, interview: Interview) -> None:
+        """Add an interview and index it by candidate ID"""
+        self._sync_index()
+        self.interviews.append(interview)
+        self.interviews_by_candidate.setdefault(interview.candidate_id, []).append(interview)
+        self._indexed_counts = (len(self.candidates), len(self.interviews))
+    
+    def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
+        """Look up a candidate by ID"""
+        self._sync_index()
+        return self.candidates_by_id.get(candidate_id)
+    
+    def get_interviews_for(self, candidate_id: str) -> List[Interview]:
+        """Get every interview scheduled for a candidate"""
+        self._sync_index()
+        return list(self.interviews_by_candidate.get(candidate_id, ()))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "messages": self.messages,
+            "current_agent": self.current_agent,
+            "context": self.context,
+            "candidates": [candidate.to_dict() for candidate in self.candidates],
+            "jobs": [job.to_dict() for job in self.jobs],
+            "interviews": [interview.to_dict() for interview in self.interviews]
+        }
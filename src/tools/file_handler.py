@@ -4,21 +4,29 @@ File handling utilities
 
 import os
 import shutil
-from typing import Dict, Any, Optional
+from typing import Dict, Any, BinaryIO, Iterator, Optional, Union
 from src.utils.config import config
 
+COPY_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 class FileHandler:
     """File handling utility"""
     
     def __init__(self):
+        config.ensure_dirs()
         self.config = config.get_config()
+        self._resumes_dir = self.config["resumes_dir"]
     
-    def save_resume_file(self, file_content: bytes, filename: str) -> str:
-        """Save resume file and return path"""
+    def save_resume_file(self, file_content: Union[bytes, BinaryIO], filename: str) -> str:
+        """Save resume bytes or a binary file object and return path"""
         try:
-            file_path = os.path.join(self.config["resumes_dir"], filename)
+            file_path = os.path.join(self._resumes_dir, filename)
             with open(file_path, 'wb') as f:
-                f.write(file_content)
+                if isinstance(file_content, (bytes, bytearray, memoryview)):
+                    f.write(file_content)
+                else:
+                    # Stream uploads in chunks instead of holding a second copy in memory
+                    shutil.copyfileobj(file_content, f, length=COPY_CHUNK_SIZE)
             return file_path
         except Exception as e:
             print(f"Error saving resume file: {e}")
@@ -37,12 +45,18 @@ class FileHandler:
     
     def get_resume_path(self, filename: str) -> str:
         """Get full path for resume file"""
-        return os.path.join(self.config["resumes_dir"], filename)
+        return os.path.join(self._resumes_dir, filename)
     
-    def list_resume_files(self) -> list:
-        """List all resume files"""
+    def iter_resume_entries(self) -> Iterator[os.DirEntry]:
+        """Iterate over the resume files as DirEntry objects with cached stat data"""
         try:
-            return os.listdir(self.config["resumes_dir"])
+            with os.scandir(self._resumes_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        yield entry
         except Exception as e:
             print(f"Error listing resume files: {e}")
-            return []
+    
+    def list_resume_files(self) -> list:
+        """List all resume files"""
+        return [entry.name for entry in self.iter_resume_entries()]
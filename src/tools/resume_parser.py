@@ -4,9 +4,170 @@ Resume parsing tools
 
 import re
 import fitz  # PyMuPDF
-import pdfplumber
+import pypdfium2 as pdfium
 from typing import Dict, List, Optional, Any
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_EMAIL_LOCAL_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.-|')
+
+# Patterns are compiled once here and tried in order by the extractors below
+_NAME_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'^[A-Z][a-z]+\s+[A-Z][a-z]+$',  # First Last
+    r'^[A-Z][a-z]+\s+[A-Z]\.\s+[A-Z][a-z]+$',  # First M. Last
+    r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+$',  # First Middle Last
+    r'^[A-Z][A-Z\s]+$',  # ALL CAPS names
+))
+
+_CONTACT_NAME_RE = re.compile(r'name[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE)
+
+# "Name - Resume" style titles are matched as a whole run of words plus a suffix check,
+# since retrying the run pattern at every word goes quadratic on long runs of words
+_NAME_RUN_RE = re.compile(r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*', re.IGNORECASE)
+_NAME_SUFFIX_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\s*[-|]\s*resume',
+    r'\s*[-|]\s*cv'
+))
+
+_PHONE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # Standard US format
+    r'\b\d{3}-\d{3}-\d{4}\b',
+    r'\b\d{3}\.\d{3}\.\d{4}\b',
+    r'\b\d{3}\s\d{3}\s\d{4}\b',
+    r'\b\(\d{3}\)\s\d{3}-\d{4}\b',
+    # International format
+    r'\b\+\d{1,3}\s\d{3}-\d{3}-\d{4}\b',
+    r'\b\+\d{1,3}\s\d{3}\s\d{3}\s\d{4}\b',
+    # Indian format (10 digits)
+    r'\b\d{10}\b',
+    r'\b\d{5}\s\d{5}\b',
+    r'\b\d{3}\s\d{3}\s\d{4}\b',
+    r'\b\d{2}\s\d{4}\s\d{4}\b',
+    r'\b\d{4}\s\d{3}\s\d{3}\b',
+    # With country code
+    r'\b\+91\s?\d{10}\b',
+    r'\b\+1\s?\d{10}\b',
+    r'\b\+91\s?\d{5}\s\d{5}\b',
+    r'\b\+91\s?\d{3}\s\d{3}\s\d{4}\b',
+    # Various separators
+    r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b',
+    r'\b\d{3}[-.\s]\d{4}[-.\s]\d{3}\b'
+))
+
+# Runs of the characters phone numbers are made of, starting at their first possible character
+_PHONE_RUN_RE = re.compile(r'[(+]?\d[\d\s().+-]*')
+_PHONE_MIN_DIGITS = 10
+
+# Any 10-15 digit run that might be a phone number
+_DIGIT_RUN_RE = re.compile(r'\b\d{10,15}\b')
+
+_EXPERIENCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Standard formats
+    r'(\d+)\s*years?\s*of\s*experience',
+    r'(\d+)\s*years?\s*experience',
+    r'experience:\s*(\d+)\s*years?',
+    r'(\d+)\+\s*years?',
+    # Alternative formats
+    r'(\d+)\s*years?\s*in\s*the\s*field',
+    r'(\d+)\s*years?\s*of\s*work',
+    r'(\d+)\s*years?\s*professional',
+    r'(\d+)\s*years?\s*industry',
+    # With months
+    r'(\d+)\s*years?\s*(\d+)\s*months?\s*experience',
+    r'(\d+)\s*years?\s*(\d+)\s*months?',
+    # Experience keywords
+    r'experience.*?(\d+)\s*years?',
+    r'(\d+)\s*years?.*?experience',
+    # Work history patterns
+    r'worked\s*for\s*(\d+)\s*years?',
+    r'(\d+)\s*years?\s*of\s*work\s*history',
+    # Internship/part-time
+    r'(\d+)\s*years?\s*internship',
+    r'(\d+)\s*years?\s*part.?time',
+    # Project experience
+    r'(\d+)\s*years?\s*project\s*experience'
+))
+
+_DATE_RANGE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d{4})\s*[-–]\s*(\d{4}|\bpresent\b|\bcurrent\b)',
+    r'(\d{4})\s*to\s*(\d{4}|\bpresent\b|\bcurrent\b)',
+    r'(\d{4})\s*-\s*(\d{4}|\bpresent\b|\bcurrent\b)'
+))
+
+# parse_pdf_parallel splits documents longer than this across worker processes
+PARALLEL_PAGE_THRESHOLD = 20
+
+def _extract_pages(pdf_path: str, start: int, stop: int) -> str:
+    """Extract the text of a range of pages, run inside a worker process"""
+    doc = fitz.open(pdf_path)
+    try:
+        return "".join(doc[index].get_text("text") for index in range(start, stop))
+    finally:
+        doc.close()
+
+def _extract_pages_parallel(pdf_path: str, page_count: int, workers: int) -> str:
+    """Extract all pages with one contiguous page range per worker process"""
+    workers = min(workers, page_count)
+    chunk = -(-page_count // workers)
+    starts = list(range(0, page_count, chunk))
+    stops = [min(start + chunk, page_count) for start in starts]
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        # map keeps the page ranges in document order
+        return "".join(executor.map(_extract_pages, [pdf_path] * len(starts), starts, stops))
+
+def _find_email(text: str) -> Optional[str]:
+    """Find the first email by matching only around each '@' instead of at every offset"""
+    at = text.find('@')
+    while at != -1:
+        # Every match holds exactly one '@', so it lies within the character runs around it
+        start = at
+        while start > 0 and text[start - 1] in _EMAIL_LOCAL_CHARS:
+            start -= 1
+        end = at + 1
+        while end < len(text) and text[end] in _EMAIL_DOMAIN_CHARS:
+            end += 1
+        # One extra character keeps the trailing \b looking at the real neighbour
+        match = _EMAIL_RE.search(text, start, end + 1)
+        if match:
+            return match.group()
+        at = text.find('@', at + 1)
+    return None
+
+def _find_titled_name(text: str) -> Optional[str]:
+    """Find the first name written as a title, such as Name - Resume or Name | CV"""
+    for suffix in _NAME_SUFFIX_PATTERNS:
+        # A match can only end where a run of words ends, so each run is checked once
+        for run in _NAME_RUN_RE.finditer(text):
+            if suffix.match(text, run.end()):
+                return run.group()
+    return None
+
+def _find_phone(text: str) -> Optional[str]:
+    """Find the first phone number by pattern priority, scanning only digit-heavy runs"""
+    # Every phone pattern needs at least ten digits and no characters outside these runs
+    runs = [
+        (match.start(), match.end()) for match in _PHONE_RUN_RE.finditer(text)
+        if match.end() - match.start() >= _PHONE_MIN_DIGITS
+        and sum(char.isdigit() for char in match.group()) >= _PHONE_MIN_DIGITS
+    ]
+    for pattern in _PHONE_PATTERNS:
+        for start, end in runs:
+            # One extra character keeps the trailing \b looking at the real neighbour
+            match = pattern.search(text, start, end + 1)
+            if match:
+                return match.group()
+    
+    # Try to find any sequence of 10-15 digits that might be a phone number;
+    # those lie inside the same runs, so the rest of the text is never rescanned
+    for start, end in runs:
+        for match in _DIGIT_RUN_RE.finditer(text, start, end + 1):
+            # Filter out obvious non-phone numbers (like years, IDs, etc.)
+            digit = match.group()
+            if len(digit) == 10 or len(digit) == 11:
+                return digit
+    return None
 
 class ResumeParser:
     """Resume parsing utility"""
@@ -26,162 +187,108 @@ class ResumeParser:
             # Other
             'git', 'linux', 'agile', 'scrum', 'rest api', 'microservices'
         ]
+        # Keywords paired with their lowercase form, which is all extract_skills compares
+        self._skill_terms = tuple(dict.fromkeys((skill, skill.lower()) for skill in self.skills_keywords))
     
     def parse_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF resume"""
         try:
-            text = ""
             # Try with PyMuPDF first
             try:
                 doc = fitz.open(pdf_path)
-                for page in doc:
-                    text += page.get_text()
+                parts = [page.get_text("text") for page in doc]
                 doc.close()
             except:
-                # Fallback to pdfplumber
-                with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages:
-                        text += page.extract_text() or ""
+                # Fallback to pdfium, which is much faster than pdfplumber on long documents
+                pdf = pdfium.PdfDocument(pdf_path)
+                try:
+                    parts = [page.get_textpage().get_text_range() for page in pdf]
+                finally:
+                    pdf.close()
             
-            return text.strip()
+            return "".join(parts).strip()
         except Exception as e:
             print(f"Error parsing PDF: {e}")
             return ""
     
+    def parse_pdf_parallel(self, pdf_path: str, workers: Optional[int] = None) -> str:
+        """Extract text from a long PDF resume using several processes"""
+        workers = workers or os.cpu_count() or 1
+        if workers < 2:
+            return self.parse_pdf(pdf_path)
+        
+        try:
+            doc = fitz.open(pdf_path)
+            page_count = doc.page_count
+            doc.close()
+        except Exception as e:
+            print(f"Error parsing PDF: {e}")
+            return ""
+        
+        # Process start-up costs more than it saves on short documents
+        if page_count <= PARALLEL_PAGE_THRESHOLD:
+            return self.parse_pdf(pdf_path)
+        
+        try:
+            return _extract_pages_parallel(pdf_path, page_count, workers).strip()
+        except Exception as e:
+            print(f"Error parsing PDF in parallel: {e}")
+            return self.parse_pdf(pdf_path)
+    
     def extract_email(self, text: str) -> Optional[str]:
         """Extract email from text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else None
+        return _find_email(text)
     
     def extract_name(self, text: str) -> Optional[str]:
         """Extract candidate name from text"""
         # Look for common name patterns at the beginning of the resume
-        lines = text.split('\n')
+        # Only the first 10 lines are checked, so stop splitting after them
+        lines = text.split('\n', 10)[:10]
         
         # Check first few lines for name patterns
-        for i, line in enumerate(lines[:10]):  # Check first 10 lines
+        for i, line in enumerate(lines):
             line = line.strip()
             if len(line) > 0 and len(line) < 50:  # Reasonable name length
                 # Look for patterns like "First Last" or "First M. Last"
-                name_patterns = [
-                    r'^[A-Z][a-z]+\s+[A-Z][a-z]+$',  # First Last
-                    r'^[A-Z][a-z]+\s+[A-Z]\.\s+[A-Z][a-z]+$',  # First M. Last
-                    r'^[A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+$',  # First Middle Last
-                    r'^[A-Z][A-Z\s]+$',  # ALL CAPS names
-                ]
-                
-                for pattern in name_patterns:
-                    if re.match(pattern, line):
+                for pattern in _NAME_PATTERNS:
+                    if pattern.match(line):
                         return line.strip()
         
         # If no clear name found, try to extract from contact information
-        contact_patterns = [
-            r'name[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*[-|]\s*resume',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*[-|]\s*cv'
-        ]
+        match = _CONTACT_NAME_RE.search(text)
+        if match:
+            return match.group(1).strip()
         
-        for pattern in contact_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0].strip()
+        name = _find_titled_name(text)
+        if name:
+            return name.strip()
         
         return None
     
     def extract_phone(self, text: str) -> Optional[str]:
         """Extract phone number from text"""
-        # More comprehensive phone patterns
-        phone_patterns = [
-            # Standard US format
-            r'\b\d{3}-\d{3}-\d{4}\b',
-            r'\b\d{3}\.\d{3}\.\d{4}\b',
-            r'\b\d{3}\s\d{3}\s\d{4}\b',
-            r'\b\(\d{3}\)\s\d{3}-\d{4}\b',
-            # International format
-            r'\b\+\d{1,3}\s\d{3}-\d{3}-\d{4}\b',
-            r'\b\+\d{1,3}\s\d{3}\s\d{3}\s\d{4}\b',
-            # Indian format (10 digits)
-            r'\b\d{10}\b',
-            r'\b\d{5}\s\d{5}\b',
-            r'\b\d{3}\s\d{3}\s\d{4}\b',
-            r'\b\d{2}\s\d{4}\s\d{4}\b',
-            r'\b\d{4}\s\d{3}\s\d{3}\b',
-            # With country code
-            r'\b\+91\s?\d{10}\b',
-            r'\b\+1\s?\d{10}\b',
-            r'\b\+91\s?\d{5}\s\d{5}\b',
-            r'\b\+91\s?\d{3}\s\d{3}\s\d{4}\b',
-            # Various separators
-            r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b',
-            r'\b\d{3}[-.\s]\d{4}[-.\s]\d{3}\b'
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                return phones[0]
-        
-        # Try to find any sequence of 10-15 digits that might be a phone number
-        digit_pattern = r'\b\d{10,15}\b'
-        digits = re.findall(digit_pattern, text)
-        if digits:
-            # Filter out obvious non-phone numbers (like years, IDs, etc.)
-            for digit in digits:
-                if len(digit) == 10 or len(digit) == 11:
-                    return digit
-        
-        return None
+        return _find_phone(text)
     
-    def extract_skills(self, text: str) -> List[str]:
+    def extract_skills(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract skills from text"""
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in self.skills_keywords:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
+        if text_lower is None:
+            text_lower = text.lower()
         
-        return list(set(found_skills))
+        return [skill for skill, skill_lower in self._skill_terms if skill_lower in text_lower]
     
-    def extract_experience(self, text: str) -> Optional[str]:
+    def extract_experience(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """Extract experience information"""
-        # More comprehensive experience patterns
-        exp_patterns = [
-            # Standard formats
-            r'(\d+)\s*years?\s*of\s*experience',
-            r'(\d+)\s*years?\s*experience',
-            r'experience:\s*(\d+)\s*years?',
-            r'(\d+)\+\s*years?',
-            # Alternative formats
-            r'(\d+)\s*years?\s*in\s*the\s*field',
-            r'(\d+)\s*years?\s*of\s*work',
-            r'(\d+)\s*years?\s*professional',
-            r'(\d+)\s*years?\s*industry',
-            # With months
-            r'(\d+)\s*years?\s*(\d+)\s*months?\s*experience',
-            r'(\d+)\s*years?\s*(\d+)\s*months?',
-            # Experience keywords
-            r'experience.*?(\d+)\s*years?',
-            r'(\d+)\s*years?.*?experience',
-            # Work history patterns
-            r'worked\s*for\s*(\d+)\s*years?',
-            r'(\d+)\s*years?\s*of\s*work\s*history',
-            # Internship/part-time
-            r'(\d+)\s*years?\s*internship',
-            r'(\d+)\s*years?\s*part.?time',
-            # Project experience
-            r'(\d+)\s*years?\s*project\s*experience'
-        ]
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for pattern in exp_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if len(matches[0]) == 2:  # Years and months
-                    years, months = matches[0]
+        for pattern in _EXPERIENCE_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                if pattern.groups == 2:  # Years and months
+                    years, months = match.groups()
                     return f"{years} years {months} months"
                 else:
-                    return f"{matches[0]} years"
+                    return f"{match.group(1)} years"
         
         # Try to extract from work history sections
         work_sections = [
@@ -190,16 +297,10 @@ class ResumeParser:
         ]
         
         for section in work_sections:
-            if section.lower() in text.lower():
+            if section in text_lower:
                 # Look for date ranges that might indicate experience
-                date_patterns = [
-                    r'(\d{4})\s*[-–]\s*(\d{4}|\bpresent\b|\bcurrent\b)',
-                    r'(\d{4})\s*to\s*(\d{4}|\bpresent\b|\bcurrent\b)',
-                    r'(\d{4})\s*-\s*(\d{4}|\bpresent\b|\bcurrent\b)'
-                ]
-                
-                for pattern in date_patterns:
-                    date_matches = re.findall(pattern, text, re.IGNORECASE)
+                for pattern in _DATE_RANGE_PATTERNS:
+                    date_matches = pattern.findall(text)
                     if date_matches:
                         # Calculate years from date ranges
                         for start_year, end_year in date_matches:
@@ -236,31 +337,35 @@ class ResumeParser:
             'project': '0-1 years'
         }
         
-        text_lower = text.lower()
         for keyword, experience in experience_keywords.items():
             if keyword in text_lower:
                 return experience
         
         return None
     
-    def extract_education(self, text: str) -> Optional[str]:
+    def extract_education(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """Extract education information"""
         edu_keywords = [
             'bachelor', 'master', 'phd', 'degree', 'university', 'college',
             'b.s.', 'b.a.', 'm.s.', 'm.a.', 'mba', 'ph.d.'
         ]
         
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         education_info = []
+        sentences = None
         
         for keyword in edu_keywords:
-            if keyword in text_lower:
-                # Extract sentences containing education keywords
-                sentences = text.split('.')
-                for sentence in sentences:
-                    if keyword in sentence.lower():
-                        education_info.append(sentence.strip())
-                        break
+            position = text_lower.find(keyword)
+            if position != -1:
+                if sentences is None:
+                    sentences = text.split('.')
+                
+                # The first occurrence lies in the first sentence containing the keyword,
+                # unless the keyword itself spans a '.' and so never fits in one sentence
+                sentence = sentences[text_lower.count('.', 0, position)]
+                if keyword in sentence.lower():
+                    education_info.append(sentence.strip())
         
         return '; '.join(education_info) if education_info else None
     
@@ -272,13 +377,16 @@ class ResumeParser:
         if not text:
             return {"error": "No text content found"}
         
+        # Lowercase once and share it with every extractor that needs it
+        text_lower = text.lower()
+        
         parsed_data = {
             "name": self.extract_name(text),
             "email": self.extract_email(text),
             "phone": self.extract_phone(text),
-            "skills": self.extract_skills(text),
-            "experience": self.extract_experience(text),
-            "education": self.extract_education(text),
+            "skills": self.extract_skills(text, text_lower),
+            "experience": self.extract_experience(text, text_lower),
+            "education": self.extract_education(text, text_lower),
             "raw_text": text
         }
         
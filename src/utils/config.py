@@ -4,7 +4,7 @@ Configuration management for the recruitment assistant
 
 import os
 from dotenv import load_dotenv
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 load_dotenv()
 
@@ -19,19 +19,28 @@ class Config:
         self.jobs_file = os.path.join(self.data_dir, "jobs.json")
         self.interviews_file = os.path.join(self.data_dir, "interviews.json")
         
-        # Create directories if they don't exist
-        os.makedirs(self.data_dir, exist_ok=True)
-        os.makedirs(self.resumes_dir, exist_ok=True)
+        # Directories are created by the first component that stores files, not on import
+        self._dirs_ready = False
+        self._config: Optional[Dict[str, Any]] = None
+    
+    def ensure_dirs(self):
+        """Create the data directories if they don't exist"""
+        if not self._dirs_ready:
+            os.makedirs(self.data_dir, exist_ok=True)
+            os.makedirs(self.resumes_dir, exist_ok=True)
+            self._dirs_ready = True
     
     def get_config(self) -> Dict[str, Any]:
-        """Get configuration dictionary"""
-        return {
-            "google_api_key": self.google_api_key,
-            "data_dir": self.data_dir,
-            "resumes_dir": self.resumes_dir,
-            "candidates_file": self.candidates_file,
-            "jobs_file": self.jobs_file,
-            "interviews_file": self.interviews_file
-        }
+        """Get configuration dictionary, built once and shared"""
+        if self._config is None:
+            self._config = {
+                "google_api_key": self.google_api_key,
+                "data_dir": self.data_dir,
+                "resumes_dir": self.resumes_dir,
+                "candidates_file": self.candidates_file,
+                "jobs_file": self.jobs_file,
+                "interviews_file": self.interviews_file
+            }
+        return self._config
 
 config = Config()
\ No newline at end of file
@@ -2,11 +2,16 @@
 Helper functions for the recruitment assistant
 """
 
-import json
 import os
+import threading
 import uuid
+import orjson
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+# Allow non-string keys, which the stdlib json module used to coerce to strings
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 
 def generate_id() -> str:
     """Generate a unique ID"""
@@ -16,11 +21,32 @@ def get_timestamp() -> str:
     """Get current timestamp"""
     return datetime.now().isoformat()
 
+@lru_cache(maxsize=1024)
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO timestamp, reusing the result for strings seen before"""
+    return datetime.fromisoformat(value)
+
+def parse_csv_list(text: str) -> List[str]:
+    """Split comma-separated input into stripped, lowercased, de-duplicated items"""
+    if not text:
+        return []
+    return list(dict.fromkeys(item.strip().lower() for item in text.split(',') if item.strip()))
+
 def save_json(data: Dict[str, Any], filepath: str) -> bool:
     """Save data to JSON file"""
     try:
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Serialize before opening so a bad record cannot truncate the file
+        content = orjson.dumps(data, option=_JSON_OPTIONS | orjson.OPT_INDENT_2)
+        # Write a sibling temp file and swap it in, so a crash mid-write leaves the old file
+        tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
         return True
     except Exception as e:
         print(f"Error saving to {filepath}: {e}")
@@ -30,8 +56,8 @@ def load_json(filepath: str) -> Dict[str, Any]:
     """Load data from JSON file"""
     try:
         if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
         return {}
     except Exception as e:
         print(f"Error loading from {filepath}: {e}")
@@ -49,15 +75,69 @@ def append_to_json_list(data: Dict[str, Any], filepath: str, key: str = "items")
         print(f"Error appending to {filepath}: {e}")
         return False
 
+def append_jsonl(records: List[Any], filepath: str) -> bool:
+    """Append records to a JSONL file, one JSON document per line"""
+    try:
+        content = b''.join(orjson.dumps(record, option=_JSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+                           for record in records)
+        with open(filepath, 'ab') as f:
+            f.write(content)
+        return True
+    except Exception as e:
+        print(f"Error appending to {filepath}: {e}")
+        return False
+
+def load_jsonl(filepath: str) -> List[Any]:
+    """Load records from a JSONL file, skipping lines that do not parse"""
+    records = []
+    try:
+        if os.path.exists(filepath):
+            with open(filepath, 'rb') as f:
+                for line in f:
+                    try:
+                        records.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        # A torn final line from an interrupted append
+                        continue
+        return records
+    except Exception as e:
+        print(f"Error loading from {filepath}: {e}")
+        return records
+
+# (filepath, key) -> (file signature, items, first item per key value)
+_INDEX_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], List[Dict[str, Any]], Dict[Any, Dict[str, Any]]]] = {}
+
 def search_in_json(filepath: str, key: str, value: Any) -> Optional[Dict[str, Any]]:
-    """Search for an item in JSON file"""
+    """Search for an item in JSON file, indexing it by key until the file changes"""
     try:
-        data = load_json(filepath)
-        items = data.get("items", [])
-        for item in items:
-            if item.get(key) == value:
-                return item
-        return None
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = _INDEX_CACHE.get((filepath, key))
+        if cached is None or cached[0] != signature:
+            items = load_json(filepath).get("items", [])
+            index = {}
+            for item in items:
+                try:
+                    # Keep the first match, as the linear scan did
+                    index.setdefault(item.get(key), item)
+                except TypeError:
+                    continue
+            cached = (signature, items, index)
+            _INDEX_CACHE[(filepath, key)] = cached
+        
+        _, items, index = cached
+        try:
+            return index.get(value)
+        except TypeError:
+            # Unhashable values cannot use the index
+            for item in items:
+                if item.get(key) == value:
+                    return item
+            return None
     except Exception as e:
         print(f"Error searching in {filepath}: {e}")
         return None
\ No newline at end of file